@@ -123,6 +123,16 @@ class MagnetSlidingVariableCoil(Scene):
         volt_label = Text("Voltage", font_size=24).next_to(volt_axes, UP)
         volt_x_label = Text("Time (s)", font_size=16).next_to(volt_axes, DOWN).shift(RIGHT * 2)
         
+        # The axes never move, so cache each affine c2p basis once
+        def point_mapper(axes):
+            origin = axes.c2p(0, 0)
+            ex = axes.c2p(1, 0) - origin
+            ey = axes.c2p(0, 1) - origin
+            return lambda ts, vs: origin + np.outer(ts, ex) + np.outer(vs, ey)
+        
+        to_flux_points = point_mapper(flux_axes)
+        to_volt_points = point_mapper(volt_axes)
+        
         self.add(flux_axes, flux_label, volt_axes, volt_label, volt_x_label)
         
         # Legend Group
@@ -156,8 +166,8 @@ class MagnetSlidingVariableCoil(Scene):
             num_points = 1000 
             t_values = np.linspace(0, duration, num_points)
             
-            flux_points = []
-            volt_points = []
+            flux_values = []
+            volt_values = []
             
             for t in t_values:
                 # Magnet Position
@@ -179,9 +189,14 @@ class MagnetSlidingVariableCoil(Scene):
                 
                 if t <= 0.05 or t >= duration - 0.05: v = 0
                 
-                flux_points.append(flux_axes.c2p(t, f))
-                volt_points.append(volt_axes.c2p(t, v))
+                flux_values.append(f)
+                volt_values.append(v)
                 
+            # Display-only data, so float32 is plenty (the derivative above stays float64)
+            t_values = t_values.astype(np.float32)
+            flux_points = to_flux_points(t_values, np.array(flux_values, dtype=np.float32))
+            volt_points = to_volt_points(t_values, np.array(volt_values, dtype=np.float32))
+
             # Create curve VMobjects
             flux_curve = VMobject(color=color, stroke_width=3)
             flux_curve.set_points_as_corners([flux_points[0], flux_points[0]])
@@ -4,6 +4,7 @@ Physics: Analytical Flux (Circle-Square Intersection)
 Visuals: Flat XY Plane (Z=0), Cyclic Motion, Highlighted Front Leg
 """
 from manim import *
+import math
 import numpy as np
 
 # --- Analytical Physics Logic ---
@@ -11,23 +12,18 @@ import numpy as np
 def circle_segment_area(r, x):
     """
     Area of circular segment to the LEFT of vertical line at relative position x.
-    Circle center at (0,0).
+    Circle center at (0,0). Works elementwise on arrays of x.
     """
-    # Clamp x
-    if x <= -r: return 0
-    if x >= r: return np.pi * r**2
+    # Clamp x: past the left edge the cap is empty, past the right it is the full circle
+    x = np.clip(x, -r, r)
     
     # Formula for area of cap cut by chord at distance d from center
-    d = abs(x)
+    d = np.abs(x)
     # Area of cap = r^2 * acos(d/r) - d * sqrt(r^2 - d^2)
     cap_area = r**2 * np.arccos(d/r) - d * np.sqrt(r**2 - d**2)
     
-    if x > 0:
-        # Line is on right, area is Total - Right Cap
-        return np.pi * r**2 - cap_area
-    else:
-        # Line is on left, area is Left Cap
-        return cap_area
+    # Line on right: Total - Right Cap. Line on left: Left Cap
+    return np.where(x > 0, np.pi * r**2 - cap_area, cap_area)
 
 def calculate_exact_flux(magnet_x, coil_width, magnet_radius):
     """
@@ -68,7 +64,8 @@ class SingleLoopScene(ThreeDScene):
         total_frames = int(total_duration * fps)
         
         # 3. Pre-calculate Motion and Physics Data
-        t_values = np.linspace(0, total_duration, total_frames)
+        # Display-only data, so float32 is plenty
+        t_values = np.linspace(0, total_duration, total_frames, dtype=np.float32)
         x_values = []
         
         # Build piecewise position array
@@ -77,9 +74,8 @@ class SingleLoopScene(ThreeDScene):
         half_cycle = cycle_time / 2.0
         
         for t in t_values:
-            # Determine which cycle we are in
-            cycle_idx = int(t / cycle_time)
-            time_in_cycle = t % cycle_time
+            # Position within the current cycle (t >= 0, so fmod == %)
+            time_in_cycle = math.fmod(t, cycle_time)
             
             if time_in_cycle < half_cycle:
                 # Moving IN: Start -> Center
@@ -107,13 +103,10 @@ class SingleLoopScene(ThreeDScene):
             
             x_values.append(x)
             
-        x_values = np.array(x_values)
+        x_values = np.array(x_values, dtype=np.float32)
         
-        # Calculate Flux
-        flux_data = []
-        for x in x_values:
-            f = calculate_exact_flux(x, coil_side, magnet_radius)
-            flux_data.append(f)
+        # Calculate Flux (one vectorized pass, stays float32)
+        flux_data = calculate_exact_flux(x_values, coil_side, np.float32(magnet_radius))
             
         # Calculate Voltage: V = -dPhi/dt
         dt = total_duration / (total_frames - 1)
@@ -165,7 +158,7 @@ class SingleLoopScene(ThreeDScene):
         voltmeter.next_to(front_leg_2d, DOWN, buff=0.1)
         
         # Magnet
-        magnet = Cylinder(radius=magnet_radius, height=0.5, direction=OUT, resolution=24)
+        magnet = Cylinder(radius=magnet_radius, height=0.5, direction=OUT, resolution=(1, 12))
         magnet.set_color(RED)
         magnet.set_opacity(0.9)
         n_label = Text("N", font_size=32).move_to([0,0,0.26])
@@ -186,6 +179,14 @@ class SingleLoopScene(ThreeDScene):
             axis_config={"include_tip": False},
         ).to_corner(UL)
         
+        # The axes never move, so cache the affine c2p basis once
+        origin = axes.c2p(0, 0)
+        ex = axes.c2p(1, 0) - origin
+        ey = axes.c2p(0, 1) - origin
+        
+        def to_points(ts, vs):
+            return origin + np.outer(ts, ex) + np.outer(vs, ey)
+        
         # Manual Labels
         x_label = Text("Time", font_size=20).next_to(axes.x_axis, DOWN)
         y_label = Text("Voltage", font_size=20).rotate(90*DEGREES).next_to(axes.y_axis, LEFT)
@@ -194,7 +195,7 @@ class SingleLoopScene(ThreeDScene):
         
         # Graph curve
         curve = VMobject(color=YELLOW, stroke_width=4)
-        full_points = [axes.c2p(t, v) for t, v in zip(t_values, scaled_voltage)]
+        full_points = to_points(t_values, scaled_voltage)
         curve.set_points_as_corners([full_points[0], full_points[0]])
         
         self.add_fixed_in_frame_mobjects(bg, axes, x_label, y_label, curve)
@@ -204,21 +205,14 @@ class SingleLoopScene(ThreeDScene):
         self.add(timer)
         
         # Magnet Position Updater
-        # Use helper to get X from time
-        def get_magnet_x(t):
-            cycle_idx = int(t / cycle_time)
-            time_in_cycle = t % cycle_time
-            if time_in_cycle < half_cycle:
-                prog = time_in_cycle / half_cycle
-                return start_x + (center_x - start_x) * prog
-            else:
-                prog = (time_in_cycle - half_cycle) / half_cycle
-                return center_x + (start_x - center_x) * prog
+        # Reuse the precomputed x_values as a per-frame lookup table
+        # (samples are total_duration / (total_frames - 1) apart, from linspace)
+        def update_magnet(m):
+            t = timer.get_value()
+            idx = min(total_frames - 1, round(t / total_duration * (total_frames - 1)))
+            m.move_to(np.array([x_values[idx], 0.0, 0.0]) + scene_shift)
 
-        magnet_group.add_updater(lambda m: m.move_to([
-            get_magnet_x(timer.get_value()),
-            0, 0
-        ] + scene_shift))
+        magnet_group.add_updater(update_magnet)
         
         # Curve Updater
         curve.add_updater(lambda m: m.set_points_as_corners(
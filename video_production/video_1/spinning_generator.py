@@ -21,6 +21,11 @@ class SpinningGenerator(Scene):
         
         # --- BUILD STATOR (Bottom Layer) ---
         coils = VGroup()
+        # Using DashedVMobject for the coil look as per reference style
+        # Dashes are computed once on a prototype and copied per coil
+        coil_proto = DashedVMobject(
+            Circle(radius=MAGNET_RADIUS, color=ORANGE, stroke_width=6), num_dashes=12
+        )
         for i in range(NUM_COILS):
             # Calculate angle
             coil_angle = (PI / 2.0) - (i * (2 * PI / NUM_COILS))
@@ -28,10 +33,7 @@ class SpinningGenerator(Scene):
             x = MAGNET_PATH_RADIUS * math.cos(coil_angle)
             y = MAGNET_PATH_RADIUS * math.sin(coil_angle)
             
-            # Using DashedVMobject for the coil look as per reference style
-            base_circle = Circle(radius=MAGNET_RADIUS, color=ORANGE, stroke_width=6)
-            coil = DashedVMobject(base_circle, num_dashes=12)
-            
+            coil = coil_proto.copy()
             coil.move_to(np.array([x, y, 0]))
             coils.add(coil)
             
@@ -45,6 +47,9 @@ class SpinningGenerator(Scene):
         
         # The Magnets
         magnets = VGroup()
+        # Render each N/S glyph once and copy it per magnet
+        n_glyph = Text("N", font_size=36, color=WHITE)
+        s_glyph = Text("S", font_size=36, color=WHITE)
         for i in range(NUM_MAGNETS):
             mag_angle = (PI / 2.0) - (i * (2 * PI / NUM_MAGNETS))
             
@@ -59,8 +64,7 @@ class SpinningGenerator(Scene):
             magnet.move_to(np.array([x, y, 0]))
             
             # Add label N/S
-            label_text = "N" if is_north else "S"
-            label = Text(label_text, font_size=36, color=WHITE).move_to(magnet.get_center())
+            label = (n_glyph if is_north else s_glyph).copy().move_to(magnet.get_center())
             
             mag_group = VGroup(magnet, label)
             magnets.add(mag_group)
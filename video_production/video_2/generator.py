@@ -1,4 +1,5 @@
 from manim import *
+from functools import lru_cache
 import math
 
 
@@ -76,6 +77,31 @@ def calculate_sinusoidal_flux(magnet_angles, magnet_polarities, coil_angle, ampl
     return total_flux
 
 
+def calculate_sinusoidal_flux_array(magnet_angles, magnet_polarities, coil_angles, amplitude=1.0, influence_width=math.pi/4):
+    """
+    Vectorized calculate_sinusoidal_flux over many time steps at once.
+
+    Args:
+        magnet_angles: (T, M) array of magnet angles, one row per time step
+        magnet_polarities: M booleans (True=North, False=South)
+        coil_angles: (T,) array of coil angles, or a single static angle
+        amplitude: Field strength multiplier
+        influence_width: Angular half-width of magnet's influence zone (radians)
+
+    Returns:
+        (T,) array of total flux through the coil
+    """
+    # Angular difference normalized to [-π, π)
+    angle_diff = (magnet_angles - np.reshape(coil_angles, (-1, 1)) + math.pi) % (2 * math.pi) - math.pi
+
+    # Raised cosine inside the influence zone, nothing outside it
+    contribution = amplitude * 0.5 * (1 + np.cos(math.pi * angle_diff / influence_width))
+    contribution[np.abs(angle_diff) >= influence_width] = 0.0
+
+    signs = np.where(magnet_polarities, 1.0, -1.0)
+    return contribution @ signs
+
+
 def calculate_sine_physics_data(
     num_magnets=2,
     rotation_speed=0.5 * math.pi,
@@ -153,6 +179,7 @@ def calculate_sine_voltage_trace(
     amplitude=10.0,
     steps=5000,
     influence_width=math.pi / 4,
+    coil_angle_array=None,
 ):
     """
     Calculate voltage trace for a coil that may move over time.
@@ -162,64 +189,51 @@ def calculate_sine_voltage_trace(
         rotation_speed: Angular velocity in rad/s
         total_time: Simulation duration
         coil_angle_func: Optional function(t) -> coil_angle for moving coils
-        coil_angle_static: Static coil angle if coil_angle_func is None
+        coil_angle_static: Static coil angle if coil_angle_func and coil_angle_array are None
         amplitude: Peak flux amplitude
         steps: Number of data points
         influence_width: Angular half-width of magnet influence zone (radians)
                         Should be calculated as: 2 * MAGNET_RADIUS / MAGNET_PATH_RADIUS
+        coil_angle_array: Optional (steps,) array of coil angles sampled at
+                          t = step * total_time / steps; skips the per-step callback
 
     Returns:
-        List of (time, voltage) tuples
+        float32 np.ndarray of shape (steps, 2): column 0 is time, column 1 is voltage
     """
     dt = total_time / steps
-
-    # Setup magnets
-    magnet_angles_start = []
-    magnet_polarities = []
-    for i in range(num_magnets):
-        theta = (math.pi / 2.0) - (i * (2 * math.pi / num_magnets))
-        magnet_angles_start.append(theta)
-        magnet_polarities.append(i % 2 == 0)
-
-    voltage_trace = []
-    prev_flux = None
-
-    for step in range(steps):
-        t = step * dt
-
-        # Get coil angle (may be time-varying)
-        if coil_angle_func is not None:
-            coil_angle = coil_angle_func(t)
-        else:
-            coil_angle = coil_angle_static
-
-        # Rotate magnets
-        angle_delta = -rotation_speed * t
-        current_magnet_angles = [
-            (start_angle + angle_delta) % (2 * math.pi)
-            for start_angle in magnet_angles_start
-        ]
-
-        # Calculate flux
-        flux = calculate_sinusoidal_flux(
-            current_magnet_angles,
-            magnet_polarities,
-            coil_angle,
-            amplitude,
-            influence_width
-        )
-
-        # Calculate voltage (V = -dΦ/dt, Lenz's law)
-        # North entering → negative voltage, South entering → positive voltage
-        if prev_flux is not None:
-            voltage = -(flux - prev_flux) / dt
-        else:
-            voltage = 0.0
-
-        voltage_trace.append((t, voltage))
-        prev_flux = flux
-
-    return voltage_trace
+    ts = np.arange(steps) * dt
+
+    # Get coil angle (may be time-varying)
+    if coil_angle_array is not None:
+        coil_angles = np.asarray(coil_angle_array)
+    elif coil_angle_func is not None:
+        coil_angles = np.array([coil_angle_func(t) for t in ts])
+    else:
+        coil_angles = coil_angle_static
+
+    # Setup magnets (alternating N/S), then rotate them for every step at once
+    magnet_index = np.arange(num_magnets)
+    magnet_angles_start = (math.pi / 2.0) - magnet_index * (2 * math.pi / num_magnets)
+    magnet_polarities = magnet_index % 2 == 0
+    magnet_angles = (magnet_angles_start + (-rotation_speed * ts)[:, None]) % (2 * math.pi)
+
+    # Calculate flux
+    flux = calculate_sinusoidal_flux_array(
+        magnet_angles,
+        magnet_polarities,
+        coil_angles,
+        amplitude,
+        influence_width
+    )
+
+    # Calculate voltage (V = -dΦ/dt, Lenz's law)
+    # North entering → negative voltage, South entering → positive voltage
+    # The first step has no previous flux, so its voltage is 0
+    voltage = np.zeros(steps)
+    voltage[1:] = -np.diff(flux) / dt
+
+    # Traces are only plotted, so float32 is plenty
+    return np.column_stack([ts, voltage]).astype(np.float32)
 
 
 def check_valid_constants(
@@ -250,6 +264,7 @@ def check_valid_constants(
         exit(1)
 
 
+@lru_cache(maxsize=32)
 def calculate_physics_data(
     num_magnets=4,
     rotation_speed=0.375 * PI,
@@ -265,9 +280,6 @@ def calculate_physics_data(
     dt = total_time / 5000  # Resolution for graph
     steps = 5000
 
-    flux_data = []
-    voltage_data = []
-
     # Setup Initial Magnet Angles (Aligned with Visuals)
     # Visuals: Start at PI/2, rotating CLOCKWISE (rotate is negative angle)
     magnet_angles = []
@@ -282,85 +294,135 @@ def calculate_physics_data(
     # Target Coil: Default is Top Coil at PI/2
     # coil_theta is now passed in
 
-    # Simulation Loop
-    for step in range(steps):
-        t = step * dt
-        # Calculate current rotation angle delta
-        # Visuals rotate by -ROTATION_SPEED * t
-        angle_delta = -rotation_speed * t
-
-        total_flux_this_step = 0
-
-        # Check interaction with each magnet
-        for idx, mag_start_angle in enumerate(magnet_angles):
-            # Current angle of this magnet
-            current_mag_angle = (mag_start_angle + angle_delta) % (2 * math.pi)
-            theta_dist = get_theta_distance(coil_theta, current_mag_angle)
-            area = get_area_between_circle(
-                theta_dist, magnet_path_radius, magnet_radius
-            )
-
-            if magnet_polarities[idx]:
-                total_flux_this_step += area
-            else:
-                total_flux_this_step -= area
-
-        flux_data.append((t, total_flux_this_step))
+    # Simulation: every (step, magnet) pair at once as a (steps, num_magnets) grid
+    # Visuals rotate by -ROTATION_SPEED * t
+    t_arr = np.arange(steps) * dt
+    start = np.array(magnet_angles)
+    pol = np.where(magnet_polarities, 1.0, -1.0)
+    current_mag_angles = (start[None, :] - rotation_speed * t_arr[:, None]) % (2 * math.pi)
+
+    # Same model as get_theta_distance / get_area_between_circle, elementwise
+    # Wrap-safe angular distance: min(|diff|, 2PI - |diff|) in one ufunc chain
+    theta_dist = math.pi - np.abs(math.pi - np.abs(coil_theta - current_mag_angles))
+    d = 2 * magnet_path_radius * np.sin(theta_dist / 2.0)
+    r = magnet_radius
+    # Lens overlap of two equal circles as two circular segments:
+    # r^2 * (theta - sin(theta)) with theta = 2 * acos(d / 2r), no sqrt needed
+    # Only the (step, magnet) pairs that actually overlap go through the trig kernel
+    overlap = d < 2 * r
+    theta = 2 * np.arccos(d[overlap] / (2 * r))
+    area = np.zeros_like(d)
+    area[overlap] = (r**2) * (theta - np.sin(theta))
+    flux_values = (area * pol).sum(axis=1)
 
     # --- PHYSICS REFINEMENT: FIELD SMOOTHING ---
     # Solution: Apply a Gaussian Smooth to the calculated flux data.
     from scipy.ndimage import gaussian_filter1d
 
-    # Extract flux values, smooth them, and rebuild data
-    flux_values = [d[1] for d in flux_data]
     # Sigma controls the "softness" of the field.
     # sigma=50 steps (at 5000 steps/rot) is about 1% of rotation width.
     flux_values_smoothed = gaussian_filter1d(flux_values, sigma=50)
 
-    # Reconstruct the list of tuples (time, smoothed_flux)
-    flux_data = [
-        (original_tuple[0], smoothed_val)
-        for original_tuple, smoothed_val in zip(flux_data, flux_values_smoothed)
-    ]
+    # Calculate Voltage (dFlux/dt) of the SMOOTHED flux in the same pass:
+    # order=1 convolves with the derivative of the Gaussian kernel
+    voltage_values = gaussian_filter1d(flux_values, sigma=50, order=1) / dt
 
-    # Calculate Voltage (dFlux/dt) from SMOOTHED data
-    for step in range(steps):
-        t = step * dt
-        if step > 0:
-            current_flux = flux_data[step][1]
-            prev_flux = flux_data[step - 1][1]
-            voltage = (current_flux - prev_flux) / dt
-            voltage_data.append((t, voltage))
-        else:
-            voltage_data.append((t, 0))  # Initial voltage 0
+    # (steps, 2) arrays of (time, value) rows
+    flux_data = np.column_stack([t_arr, flux_values_smoothed])
+    voltage_data = np.column_stack([t_arr, voltage_values])
 
+    # Results are memoized and shared between callers, so keep them read-only
+    flux_data.flags.writeable = False
+    voltage_data.flags.writeable = False
     return flux_data, voltage_data
 
 
+# --- GRAPH HELPERS ---
+def axes_points(ax, xs, ys):
+    """
+    Map arrays of graph coordinates to an (N, 3) array of scene points.
+
+    Axes are affine, so c2p is evaluated three times to get the origin and
+    unit vectors instead of once per sample.
+    """
+    origin = ax.c2p(0, 0)
+    x_vec = ax.c2p(1, 0) - origin
+    y_vec = ax.c2p(0, 1) - origin
+    return origin + np.outer(xs, x_vec) + np.outer(ys, y_vec)
+
+
+def visible_trace_points(points, t_now, dt, subsample=3):
+    """
+    Slice the part of a precomputed trace that has been drawn by time t_now.
+
+    Keeps every `subsample`-th point plus the newest one, so the curve always
+    reaches the current sample. Always returns at least two points, which is
+    what set_points_as_corners needs.
+    """
+    idx_end = min(len(points) - 1, max(0, int(t_now / dt)))
+    visible = points[:idx_end + 1:subsample]
+    if idx_end % subsample != 0:
+        visible = np.vstack([visible, points[idx_end]])
+    if len(visible) == 1:
+        visible = np.vstack([visible, visible])
+    return visible
+
+
+def grow_trace_curve(mob, points, t_now, dt, drawn, subsample=3):
+    """
+    Extend a trace curve up to t_now, appending only the samples added since the last call.
+
+    `drawn` is a single-element list holding the last sample index already on the
+    curve (-1 when empty). If time went backwards, or nothing has been drawn yet,
+    the curve is rebuilt with visible_trace_points. An earlier off-stride tail
+    point stays in the curve as an extra corner. It is a real sample, so the
+    shape is unchanged.
+    """
+    idx_end = min(len(points) - 1, max(0, int(t_now / dt)))
+    if idx_end == drawn[0]:
+        return
+    if drawn[0] < 0 or idx_end < drawn[0]:
+        mob.set_points_as_corners(visible_trace_points(points, t_now, dt, subsample))
+    else:
+        start = (drawn[0] // subsample + 1) * subsample
+        new_points = points[start:idx_end + 1:subsample]
+        if idx_end % subsample != 0:
+            new_points = np.vstack([new_points, points[idx_end]])
+        mob.add_points_as_corners(new_points)
+    drawn[0] = idx_end
+
+
 # --- HELPER FUNCTIONS FOR OBJECT CREATION ---
-def build_coils(num_coils, magnet_path_radius, magnet_radius):
+# Geometry is built once per parameter set and cached as a template.
+# The public builders hand out copies, so callers can rotate/recolor freely.
+@lru_cache(maxsize=8)
+def _coils_template(num_coils, magnet_path_radius, magnet_radius):
     coils = VGroup()
+    # Square coil as per reference style from scene_linear_to_circular.py
+    # Built once and copied to every coil position
+    coil_proto = Rectangle(
+        width=magnet_radius * 1.5,
+        height=magnet_radius * 2.0,
+        color=ORANGE,
+        stroke_width=6
+    )
+    # All coil angles at once, first coil at 12 o'clock going clockwise
+    coil_angles = (PI / 2.0) - np.arange(num_coils) * (2 * PI / num_coils)
+    xs = magnet_path_radius * np.cos(coil_angles)
+    ys = magnet_path_radius * np.sin(coil_angles)
     for i in range(num_coils):
-        # Calculate angle
-        coil_angle = (PI / 2.0) - (i * (2 * PI / num_coils))
-
-        x = magnet_path_radius * math.cos(coil_angle)
-        y = magnet_path_radius * math.sin(coil_angle)
-
-        # Square coil as per reference style from scene_linear_to_circular.py
-        coil = Rectangle(
-            width=magnet_radius * 1.5,
-            height=magnet_radius * 2.0,
-            color=ORANGE,
-            stroke_width=6
-        )
-
-        coil.move_to(np.array([x, y, 0]))
+        coil = coil_proto.copy()
+        coil.move_to(np.array([xs[i], ys[i], 0]))
         coils.add(coil)
     return coils
 
 
-def build_rotor(num_magnets, magnet_path_radius, magnet_radius, disk_radius):
+def build_coils(num_coils, magnet_path_radius, magnet_radius):
+    return _coils_template(num_coils, magnet_path_radius, magnet_radius).copy()
+
+
+@lru_cache(maxsize=8)
+def _rotor_template(num_magnets, magnet_path_radius, magnet_radius, disk_radius):
     rotor_group = VGroup()
 
     # The Disk Body
@@ -370,22 +432,23 @@ def build_rotor(num_magnets, magnet_path_radius, magnet_radius, disk_radius):
 
     # The Magnets
     magnets = VGroup()
+    # Build each N/S magnet body and glyph once and copy them per magnet
+    n_magnet = Circle(radius=magnet_radius, color=RED, fill_opacity=0.8)
+    s_magnet = Circle(radius=magnet_radius, color=BLUE, fill_opacity=0.8)
+    n_glyph = Text("N", font_size=36, color=WHITE)
+    s_glyph = Text("S", font_size=36, color=WHITE)
+    # All magnet angles at once, first magnet at 12 o'clock going clockwise
+    mag_angles = (PI / 2.0) - np.arange(num_magnets) * (2 * PI / num_magnets)
+    xs = magnet_path_radius * np.cos(mag_angles)
+    ys = magnet_path_radius * np.sin(mag_angles)
     for i in range(num_magnets):
-        mag_angle = (PI / 2.0) - (i * (2 * PI / num_magnets))
-
-        x = magnet_path_radius * math.cos(mag_angle)
-        y = magnet_path_radius * math.sin(mag_angle)
-
         is_north = i % 2 == 0
-        color = RED if is_north else BLUE
 
-        magnet = Circle(radius=magnet_radius, color=color, fill_opacity=0.8)
-        magnet.set_fill(color)
-        magnet.move_to(np.array([x, y, 0]))
+        magnet = (n_magnet if is_north else s_magnet).copy()
+        magnet.move_to(np.array([xs[i], ys[i], 0]))
 
         # Add label N/S
-        label_text = "N" if is_north else "S"
-        label = Text(label_text, font_size=36, color=WHITE).move_to(magnet.get_center())
+        label = (n_glyph if is_north else s_glyph).copy().move_to(magnet.get_center())
 
         mag_group = VGroup(magnet, label)
         magnets.add(mag_group)
@@ -394,6 +457,12 @@ def build_rotor(num_magnets, magnet_path_radius, magnet_radius, disk_radius):
     return rotor_group
 
 
+def build_rotor(num_magnets, magnet_path_radius, magnet_radius, disk_radius):
+    return _rotor_template(
+        num_magnets, magnet_path_radius, magnet_radius, disk_radius
+    ).copy()
+
+
 class SpinningGenerator(Scene):
     def construct(self):
         # --- CONSTANTS (Scaled for Manim) ---
@@ -463,11 +532,11 @@ class SpinningGenerator(Scene):
         # Let's start with scale from START to ensure initial look is good,
         # or max of both to be safe.
         max_flux = max(
-            [abs(f[1]) for f in flux_data_start] + [abs(f[1]) for f in flux_data_end]
+            np.abs(flux_data_start[:, 1]).max(), np.abs(flux_data_end[:, 1]).max()
         )
         max_voltage = max(
-            [abs(v[1]) for v in voltage_data_start]
-            + [abs(v[1]) for v in voltage_data_end]
+            np.abs(voltage_data_start[:, 1]).max(),
+            np.abs(voltage_data_end[:, 1]).max(),
         )
 
         # Add slight padding
@@ -565,11 +634,23 @@ class SpinningGenerator(Scene):
 
         # EFFICIENT IMPLEMENTATION:
         # Pre-calc all points in axes coords for BOTH scenarios
-        flux_points_start = [flux_ax.c2p(t, f) for t, f in flux_data_start]
-        voltage_points_start = [voltage_ax.c2p(t, v) for t, v in voltage_data_start]
+        # Physics runs at 5000 steps for an accurate dFlux/dt, but the ~5.5 unit
+        # wide graphs can't resolve that many corners, so plot every 10th sample
+        PLOT_STRIDE = 10
+        flux_plot_start = flux_data_start[::PLOT_STRIDE]
+        voltage_plot_start = voltage_data_start[::PLOT_STRIDE]
+        flux_plot_end = flux_data_end[::PLOT_STRIDE]
+        voltage_plot_end = voltage_data_end[::PLOT_STRIDE]
+
+        flux_points_start = axes_points(flux_ax, flux_plot_start[:, 0], flux_plot_start[:, 1])
+        voltage_points_start = axes_points(
+            voltage_ax, voltage_plot_start[:, 0], voltage_plot_start[:, 1]
+        )
 
-        flux_points_end = [flux_ax.c2p(t, f) for t, f in flux_data_end]
-        voltage_points_end = [voltage_ax.c2p(t, v) for t, v in voltage_data_end]
+        flux_points_end = axes_points(flux_ax, flux_plot_end[:, 0], flux_plot_end[:, 1])
+        voltage_points_end = axes_points(
+            voltage_ax, voltage_plot_end[:, 0], voltage_plot_end[:, 1]
+        )
 
         # Initial Curves (Start Scenario)
         flux_curve = (
@@ -583,9 +664,18 @@ class SpinningGenerator(Scene):
         flux_dot = Dot(color=YELLOW).scale(0.8)
         voltage_dot = Dot(color=GREEN).scale(0.8)
 
+        # Full curves are built once; the updaters reveal a prefix of them
+        # instead of re-cornering every point each frame
+        flux_full_start = VMobject().set_points_as_corners(flux_points_start)
+        voltage_full_start = VMobject().set_points_as_corners(voltage_points_start)
+        flux_full_end = VMobject().set_points_as_corners(flux_points_end)
+        voltage_full_end = VMobject().set_points_as_corners(voltage_points_end)
+
         # State to switch data source
         self.current_flux_points = flux_points_start
         self.current_voltage_points = voltage_points_start
+        self.current_flux_full = flux_full_start
+        self.current_voltage_full = voltage_full_start
 
         def update_flux_curve(mob):
             t = time_tracker.get_value()
@@ -603,8 +693,10 @@ class SpinningGenerator(Scene):
             idx = int((t / TOTAL_TIME) * len(points))
             idx = max(0, min(idx, len(points) - 1))
 
-            # Set points up to index
-            mob.set_points_as_corners(points[: idx + 1])
+            # Reveal the curve up to index (idx of len(points) - 1 segments)
+            mob.pointwise_become_partial(
+                self.current_flux_full, 0, idx / (len(points) - 1)
+            )
 
             # Update dot position
             if idx < len(points):
@@ -617,7 +709,9 @@ class SpinningGenerator(Scene):
             idx = int((t / TOTAL_TIME) * len(points))
             idx = max(0, min(idx, len(points) - 1))
 
-            mob.set_points_as_corners(points[: idx + 1])
+            mob.pointwise_become_partial(
+                self.current_voltage_full, 0, idx / (len(points) - 1)
+            )
 
             if idx < len(points):
                 voltage_dot.move_to(points[idx])
@@ -628,13 +722,13 @@ class SpinningGenerator(Scene):
         # Group for animation
         graphs_dynamic = VGroup(flux_curve, voltage_curve, flux_dot, voltage_dot)
 
-        self.add(visual_group_start)
+        self.add(generator_system)
 
         self.wait(1)
 
         # Layout animation: Move generator left, fade in graphs
         p1 = self.play(
-            visual_group_start.animate.scale(0.7).to_edge(LEFT, buff=1.0),
+            generator_system.animate.scale(0.7).to_edge(LEFT, buff=1.0),
             FadeIn(graph_group),
             run_time=2,
         )
@@ -664,7 +758,7 @@ class SpinningGenerator(Scene):
         # Position them to match current generator state
         # Fix: changing positioning to match CENTER instead of re-calculating edge
         new_system = VGroup(coils_new, rotor_new).scale(0.7)
-        new_system.move_to(visual_group_start.get_center())
+        new_system.move_to(generator_system.get_center())
 
         # Important: Match rotation of the OLD rotor visual?
         # The old rotor has been rotating via updater.
@@ -677,16 +771,19 @@ class SpinningGenerator(Scene):
         rotor_group.remove_updater(rotate_logic)
 
         # Perform Transform
+        # Only the disk actually morphs; magnets and coils just cross-fade.
+        # This skips pairing every magnet/label/coil submobject in one big transform.
+        disk_old, magnets_old = rotor_group[0], rotor_group[1]
+        disk_new, magnets_new = rotor_new[0], rotor_new[1]
         self.play(
-            ReplacementTransform(visual_group_start, new_system),
-            # ReplacementTransform(rotor_group, rotor_new), # Included in VGroup transform
+            ReplacementTransform(disk_old, disk_new),
+            FadeOut(magnets_old, coils),
+            FadeIn(magnets_new, coils_new),
             run_time=1.5,
         )
 
         # Update references
-        self.remove(
-            visual_group_start
-        )  # It's been transformed out visually but variable remains
+        self.remove(generator_system)
         coils = coils_new
         rotor_group = rotor_new
         generator_system = new_system  # conceptually
@@ -695,6 +792,8 @@ class SpinningGenerator(Scene):
         # Switch Data Source
         self.current_flux_points = flux_points_end
         self.current_voltage_points = voltage_points_end
+        self.current_flux_full = flux_full_end
+        self.current_voltage_full = voltage_full_end
 
         # Reset Time Tracker for Phase 2 (since data starts from t=0)
         # But we want the graph to look continuous?
@@ -4,25 +4,23 @@ from manim import *
 import math
 
 
-def my_func(t):
-    z = t / 3
-    x = math.cos(2 * t)
-    y = math.sin(2 * t)
-    return [x, y, z]
+def my_func(ts):
+    z = ts / 3
+    x = np.cos(2 * ts)
+    y = np.sin(2 * ts)
+    return np.column_stack([x, y, z])
 
 
-def func2(t):
-    z = t / 3
-    x = math.cos(2 * t - PI)
-    y = math.sin(2 * t - PI)
-    return [x, y, z]
+def func2(ts):
+    z = ts / 3
+    x = np.cos(2 * ts - PI)
+    y = np.sin(2 * ts - PI)
+    return np.column_stack([x, y, z])
 
 
 def update_vec_field(pos):
-    x, y, z = pos
-
-    magnitude = 0.5 * z + 2
-    return np.array([0, 0, magnitude])
+    # Field only depends on z; skip unpacking and build the float vector directly
+    return np.array([0.0, 0.0, 0.5 * pos[2] + 2.0])
 
 
 class TestScene(ThreeDScene):
@@ -43,16 +41,19 @@ class TestScene(ThreeDScene):
         )
 
         # axes.shift(DOWN * 1)
-        helix = ParametricFunction(
-            lambda t: axes.c2p(*my_func(t)),
-            t_range=(0, 18),
-            color=RED,
-        ).set_shade_in_3d(True)
-
-        helix_2 = ParametricFunction(
-            lambda t: axes.c2p(*func2(t)),
-            t_range=(0, 18),
-        ).set_color(BLUE)
+        # Sample both helices in one numpy pass instead of a per-t callback.
+        # The axes map is affine, so c2p is taken once per basis vector and
+        # every sample is mapped with a single matrix product.
+        origin = axes.c2p(0, 0, 0)
+        basis = np.array([axes.c2p(1, 0, 0), axes.c2p(0, 1, 0), axes.c2p(0, 0, 1)]) - origin
+        ts = np.linspace(0, 18, 500)
+        helix = (
+            VMobject(color=RED)
+            .set_points_smoothly(origin + my_func(ts) @ basis)
+            .set_shade_in_3d(True)
+        )
+
+        helix_2 = VMobject().set_points_smoothly(origin + func2(ts) @ basis).set_color(BLUE)
 
         vector_field = ArrowVectorField(
             update_vec_field,
@@ -1,5 +1,5 @@
 from manim import *
-from generator import build_rotor
+from generator import axes_points, build_rotor
 import math
 import numpy as np
 
@@ -7,11 +7,11 @@ import numpy as np
 def build_coils_square(num_coils, path_radius, magnet_radius, start_angle=PI/2):
     """Build square coils evenly spaced around the path."""
     coils = VGroup()
-    for i in range(num_coils):
-        coil_angle = start_angle - (i * (2 * PI / num_coils))
-        x = path_radius * math.cos(coil_angle)
-        y = path_radius * math.sin(coil_angle)
-
+    # All coil angles/positions at once; the loop only instantiates mobjects
+    coil_angles = start_angle - np.arange(num_coils) * (2 * PI / num_coils)
+    xs = path_radius * np.cos(coil_angles)
+    ys = path_radius * np.sin(coil_angles)
+    for coil_angle, x, y in zip(coil_angles, xs, ys):
         coil = Rectangle(
             width=magnet_radius * 2,
             height=magnet_radius * 2,
@@ -73,17 +73,18 @@ class CoggingComparisonScene(Scene):
         # ============================================================
 
         def normalize_angle(angle):
-            """Normalize angle to [-PI, PI]."""
-            while angle > PI:
-                angle -= 2 * PI
-            while angle < -PI:
-                angle += 2 * PI
-            return angle
+            """Normalize angle (scalar or array) to [-PI, PI)."""
+            return (angle + PI) % (2 * PI) - PI
+
+        # Initial magnet angles, first magnet at 12 o'clock going clockwise
+        BASE_MAGNET_ANGLES = (PI / 2.0) - np.arange(NUM_MAGNETS) * (2 * PI / NUM_MAGNETS)
 
         def get_magnet_angles(rotation_angle):
-            """Get current magnet angles given rotation from initial position."""
-            base_angles = [(PI / 2.0) - (i * (2 * PI / NUM_MAGNETS)) for i in range(NUM_MAGNETS)]
-            return [(angle - rotation_angle) for angle in base_angles]
+            """Get current magnet angles given rotation from initial position.
+
+            Broadcasts: a (T, 1) column of rotations gives a (T, M) array.
+            """
+            return BASE_MAGNET_ANGLES - rotation_angle
 
         def get_coil_angles(num_coils):
             """Get angular positions of evenly spaced coils starting at 12 o'clock."""
@@ -99,28 +100,26 @@ class CoggingComparisonScene(Scene):
 
             4/4: All 4 magnets align at once → peak height ~4
             4/3: Only 1 magnet aligns at a time → peak height ~1
+
+            `rotation` may be a scalar or an array of rotations (e.g. one per
+            sample time); the result has the same shape.
             """
             magnet_spacing = (2 * PI) / NUM_MAGNETS
             coil_spacing = (2 * PI) / num_coils
 
-            total = 0.0
-
-            for m in range(NUM_MAGNETS):
-                # Current angle of this magnet
-                m_angle = (rotation + m * magnet_spacing) % (2 * PI)
+            # Current angle of every magnet, shape (..., M), and fixed coil angles (C,)
+            rotation = np.asarray(rotation, dtype=float)
+            # Rotations are non-negative, so fmod (no sign fix-up) matches %;
+            # coil angles are already in [0, 2*PI) and need no wrap at all
+            m_angles = np.fmod(rotation[..., None] + np.arange(NUM_MAGNETS) * magnet_spacing, 2 * PI)
+            c_angles = np.arange(num_coils) * coil_spacing
 
-                for c in range(num_coils):
-                    # Fixed angle of this coil
-                    c_angle = (c * coil_spacing) % (2 * PI)
+            # Shortest distance on circle for every magnet-coil pair, shape (..., M, C)
+            diff = np.abs(m_angles[..., :, None] - c_angles)
+            diff = np.minimum(diff, 2 * PI - diff)
 
-                    # Shortest distance on circle
-                    diff = min(abs(m_angle - c_angle), 2 * PI - abs(m_angle - c_angle))
-
-                    # Gaussian: peak at 1 when aligned, decays quickly
-                    interaction = np.exp(-(diff**2) / (2 * sigma**2))
-                    total += interaction
-
-            return total
+            # Gaussian: peak at 1 when aligned, decays quickly
+            return np.exp(-(diff * diff) / (2 * sigma * sigma)).sum(axis=(-2, -1))
 
         # Get coil angles for each configuration
         COIL_ANGLES_LEFT = get_coil_angles(NUM_COILS_LEFT)
@@ -136,19 +135,23 @@ class CoggingComparisonScene(Scene):
         LEFT_POS = np.array([-GEN_SPACING / 2, GEN_Y_OFFSET, 0])
         RIGHT_POS = np.array([GEN_SPACING / 2, GEN_Y_OFFSET, 0])
 
+        # Both generators share the same rotor and stator geometry: build once, copy
+        rotor_template = build_rotor(NUM_MAGNETS, MAGNET_PATH_RADIUS, MAGNET_RADIUS, DISK_RADIUS)
+        stator_template = Circle(radius=DISK_RADIUS + 0.1, color=GRAY, stroke_width=3, stroke_opacity=0.5)
+
         # --- LEFT GENERATOR: 4/4 (1:1 ratio) ---
-        rotor_left = build_rotor(NUM_MAGNETS, MAGNET_PATH_RADIUS, MAGNET_RADIUS, DISK_RADIUS)
+        rotor_left = rotor_template.copy()
         coils_left = build_coils_square(NUM_COILS_LEFT, MAGNET_PATH_RADIUS, MAGNET_RADIUS)
-        stator_left = Circle(radius=DISK_RADIUS + 0.1, color=GRAY, stroke_width=3, stroke_opacity=0.5)
+        stator_left = stator_template.copy()
 
         gen_left = VGroup(stator_left, coils_left, rotor_left)
         gen_left.move_to(LEFT_POS)
         disk_center_left = rotor_left.get_center()
 
         # --- RIGHT GENERATOR: 4/3 (fractional ratio) ---
-        rotor_right = build_rotor(NUM_MAGNETS, MAGNET_PATH_RADIUS, MAGNET_RADIUS, DISK_RADIUS)
+        rotor_right = rotor_template.copy()
         coils_right = build_coils_square(NUM_COILS_RIGHT, MAGNET_PATH_RADIUS, MAGNET_RADIUS)
-        stator_right = Circle(radius=DISK_RADIUS + 0.1, color=GRAY, stroke_width=3, stroke_opacity=0.5)
+        stator_right = stator_template.copy()
 
         gen_right = VGroup(stator_right, coils_right, rotor_right)
         gen_right.move_to(RIGHT_POS)
@@ -208,8 +211,8 @@ class CoggingComparisonScene(Scene):
         )
         axes_right.move_to(np.array([RIGHT_POS[0], GRAPH_Y_POS, 0]))
 
-        y_label_right = Text("Cogging", font_size=14, color=GREY)
-        y_label_right.rotate(PI / 2)
+        # Same string as the left label: copy it instead of laying out text again
+        y_label_right = y_label_left.copy()
         y_label_right.next_to(axes_right, LEFT, buff=0.1)
 
         graphs = VGroup(axes_left, y_label_left, axes_right, y_label_right)
@@ -217,25 +220,27 @@ class CoggingComparisonScene(Scene):
         # ============================================================
         # TIME TRACKER AND ROTOR UPDATERS
         # ============================================================
-        time_tracker = ValueTracker(0)
+        # Simulation time, written once per frame by drive_time during the main play;
+        # every updater reads this instead of querying a ValueTracker
+        sim_t = [0.0]
 
-        last_t = [0.0]
+        def drive_time(mob, alpha):
+            sim_t[0] = alpha * SIMULATION_TIME
 
-        def update_rotor_left(mob, dt):
-            t_now = time_tracker.get_value()
-            dt_sim = t_now - last_t[0]
-            if dt_sim != 0:
-                mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center_left)
+        last_t = [0.0]
 
-        def update_rotor_right(mob, dt):
-            t_now = time_tracker.get_value()
+        def step_rotors(dt):
+            # One step per frame: read the time once, turn both rotors
+            t_now = sim_t[0]
             dt_sim = t_now - last_t[0]
             if dt_sim != 0:
-                mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center_right)
-                last_t[0] = t_now  # Only update once per frame
+                rotor_left.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center_left)
+                rotor_right.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center_right)
+                last_t[0] = t_now
 
-        rotor_left.add_updater(update_rotor_left)
-        rotor_right.add_updater(update_rotor_right)
+        # Driven from a mobject updater on one rotor, not a scene updater: only
+        # mobjects with updaters (and everything after them) are redrawn each frame
+        rotor_left.add_updater(lambda m, dt: step_rotors(dt))
 
         # ============================================================
         # ALIGNMENT HIGHLIGHT ELEMENTS
@@ -244,18 +249,20 @@ class CoggingComparisonScene(Scene):
         def create_alignment_highlights(num_coils, path_radius, center, color):
             """Create highlight circles at each coil position."""
             highlights = VGroup()
-            for i in range(num_coils):
-                coil_angle = (PI / 2) - (i * (2 * PI / num_coils))
-                x = center[0] + path_radius * math.cos(coil_angle)
-                y = center[1] + path_radius * math.sin(coil_angle)
-                highlight = Circle(
-                    radius=MAGNET_RADIUS * 1.3,
-                    color=color,
-                    stroke_width=4,
-                    fill_opacity=0.0
-                )
+            # Build one invisible highlight ring and copy it to every coil position
+            highlight_proto = Circle(
+                radius=MAGNET_RADIUS * 1.3,
+                color=color,
+                stroke_width=4,
+                fill_opacity=0.0
+            )
+            highlight_proto.set_stroke(opacity=0)  # Start invisible
+            coil_angles = (PI / 2) - np.arange(num_coils) * (2 * PI / num_coils)
+            xs = center[0] + path_radius * np.cos(coil_angles)
+            ys = center[1] + path_radius * np.sin(coil_angles)
+            for x, y in zip(xs, ys):
+                highlight = highlight_proto.copy()
                 highlight.move_to(np.array([x, y, 0]))
-                highlight.set_stroke(opacity=0)  # Start invisible
                 highlights.add(highlight)
             return highlights
 
@@ -268,38 +275,24 @@ class CoggingComparisonScene(Scene):
 
         # Highlight updaters
         def update_highlights_left(mob):
-            t_now = time_tracker.get_value()
-            rotation = ROTATION_SPEED * t_now
-            mag_angles = get_magnet_angles(rotation)
-
-            for i, highlight in enumerate(mob):
-                coil_angle = COIL_ANGLES_LEFT[i]
-                is_aligned = False
-                for mag_angle in mag_angles:
-                    angle_diff = normalize_angle(mag_angle - coil_angle)
-                    if abs(angle_diff) < ALIGNMENT_THRESHOLD:
-                        is_aligned = True
-                        break
+            # Look up the precomputed alignment schedule (built with the cogging data)
+            t_now = sim_t[0]
+            idx = int(t_now / SIMULATION_TIME * (NUM_SAMPLES - 1))
+            idx = max(0, min(idx, NUM_SAMPLES - 1))
 
+            for highlight, is_aligned in zip(mob, aligned_left[idx]):
                 if is_aligned:
                     highlight.set_stroke(opacity=0.5)
                 else:
                     highlight.set_stroke(opacity=0)
 
         def update_highlights_right(mob):
-            t_now = time_tracker.get_value()
-            rotation = ROTATION_SPEED * t_now
-            mag_angles = get_magnet_angles(rotation)
-
-            for i, highlight in enumerate(mob):
-                coil_angle = COIL_ANGLES_RIGHT[i]
-                is_aligned = False
-                for mag_angle in mag_angles:
-                    angle_diff = normalize_angle(mag_angle - coil_angle)
-                    if abs(angle_diff) < ALIGNMENT_THRESHOLD:
-                        is_aligned = True
-                        break
+            # Look up the precomputed alignment schedule (built with the cogging data)
+            t_now = sim_t[0]
+            idx = int(t_now / SIMULATION_TIME * (NUM_SAMPLES - 1))
+            idx = max(0, min(idx, NUM_SAMPLES - 1))
 
+            for highlight, is_aligned in zip(mob, aligned_right[idx]):
                 if is_aligned:
                     highlight.set_stroke(opacity=0.5)
                 else:
@@ -320,31 +313,45 @@ class CoggingComparisonScene(Scene):
         trace_right.set_points_as_corners([axes_right.c2p(0, 0), axes_right.c2p(0, 0)])
 
         # Pre-compute cogging data for smooth curves
-        NUM_SAMPLES = 500
-        times = np.linspace(0, SIMULATION_TIME, NUM_SAMPLES)
-        cogging_left_data = []
-        cogging_right_data = []
+        # At most one sample per output pixel across the graph width (capped at 500)
+        NUM_SAMPLES = min(500, int(GRAPH_WIDTH * config.pixel_width / config.frame_width))
+        times = np.linspace(0, SIMULATION_TIME, NUM_SAMPLES, dtype=np.float32)
 
         # Use narrow sigma for sharp "detent click" peaks
         SIGMA = 0.12  # ~7 degrees - sharp but smooth
 
-        for t in times:
-            rotation = ROTATION_SPEED * t
-            cogging_left_data.append(calculate_cogging_potential(rotation, NUM_COILS_LEFT, SIGMA))
-            cogging_right_data.append(calculate_cogging_potential(rotation, NUM_COILS_RIGHT, SIGMA))
+        # All sample times in one (T, M, C) broadcast per configuration
+        rotations = ROTATION_SPEED * times
+        cogging_left_data = calculate_cogging_potential(rotations, NUM_COILS_LEFT, SIGMA)
+        cogging_right_data = calculate_cogging_potential(rotations, NUM_COILS_RIGHT, SIGMA)
+
+        # Highlight schedule: is any magnet aligned with each coil, per sample time
+        mag_angles_t = get_magnet_angles(rotations[:, None])  # (T, M)
 
-        cogging_left_data = np.array(cogging_left_data)
-        cogging_right_data = np.array(cogging_right_data)
+        def alignment_schedule(coil_angles):
+            angle_diff = normalize_angle(mag_angles_t[:, :, None] - np.asarray(coil_angles)[None, None, :])
+            return (np.abs(angle_diff) < ALIGNMENT_THRESHOLD).any(axis=1)  # (T, C)
+
+        aligned_left = alignment_schedule(COIL_ANGLES_LEFT)
+        aligned_right = alignment_schedule(COIL_ANGLES_RIGHT)
 
         # DON'T normalize separately - keep same scale so 4/4 shows bigger peaks
         # The math naturally gives: 4/4 peaks ~4, 4/3 peaks ~1
         # Scale to fit y-range of [0, 4.5]
         global_max = max(np.max(cogging_left_data), np.max(cogging_right_data))
-        cogging_left_data = cogging_left_data / global_max * 4.5
-        cogging_right_data = cogging_right_data / global_max * 4.5
+        cogging_left_data = (cogging_left_data / global_max * 4.5).astype(np.float32)
+        cogging_right_data = (cogging_right_data / global_max * 4.5).astype(np.float32)
+
+        # Map every sample to scene space once; the trace updaters only slice these
+        all_points_left = axes_points(axes_left, times, cogging_left_data)
+        all_points_right = axes_points(axes_right, times, cogging_right_data)
+
+        # Last sample index drawn by each trace, so frames only append new segments
+        last_idx_left = [0]
+        last_idx_right = [0]
 
         def update_trace_left(mob):
-            t_now = time_tracker.get_value()
+            t_now = sim_t[0]
             if t_now <= 0:
                 return
 
@@ -355,12 +362,17 @@ class CoggingComparisonScene(Scene):
             if idx < 1:
                 return
 
-            # Build path from samples
-            points = [axes_left.c2p(times[i], cogging_left_data[i]) for i in range(idx + 1)]
-            mob.set_points_as_corners(points)
+            # Extend path with the samples added since the last frame
+            if idx == last_idx_left[0]:
+                return
+            if last_idx_left[0] < 1 or idx < last_idx_left[0]:
+                mob.set_points_as_corners(all_points_left[:idx + 1])
+            else:
+                mob.add_points_as_corners(all_points_left[last_idx_left[0] + 1:idx + 1])
+            last_idx_left[0] = idx
 
         def update_trace_right(mob):
-            t_now = time_tracker.get_value()
+            t_now = sim_t[0]
             if t_now <= 0:
                 return
 
@@ -370,8 +382,13 @@ class CoggingComparisonScene(Scene):
             if idx < 1:
                 return
 
-            points = [axes_right.c2p(times[i], cogging_right_data[i]) for i in range(idx + 1)]
-            mob.set_points_as_corners(points)
+            if idx == last_idx_right[0]:
+                return
+            if last_idx_right[0] < 1 or idx < last_idx_right[0]:
+                mob.set_points_as_corners(all_points_right[:idx + 1])
+            else:
+                mob.add_points_as_corners(all_points_right[last_idx_right[0] + 1:idx + 1])
+            last_idx_right[0] = idx
 
         trace_left.add_updater(update_trace_left)
         trace_right.add_updater(update_trace_right)
@@ -397,7 +414,7 @@ class CoggingComparisonScene(Scene):
         self.add(trace_left, trace_right)
 
         self.play(
-            time_tracker.animate.set_value(SIMULATION_TIME),
+            UpdateFromAlphaFunc(Mobject(), drive_time),
             run_time=SIMULATION_TIME,
             rate_func=linear
         )
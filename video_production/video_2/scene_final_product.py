@@ -77,15 +77,14 @@ class FinalProductScene(Scene):
 
         # 9 coils at magnet path radius
         coils = VGroup()
-        for i in range(NUM_COILS):
-            coil_angle = (PI / 2.0) - (i * (2 * PI / NUM_COILS))
-
-            coil_pos = np.array([
-                MAGNET_PATH_RADIUS * math.cos(coil_angle),
-                MAGNET_PATH_RADIUS * math.sin(coil_angle),
-                0
-            ])
-
+        # All coil angles/positions at once; the loop only instantiates mobjects
+        coil_angles = (PI / 2.0) - np.arange(NUM_COILS) * (2 * PI / NUM_COILS)
+        coil_positions = np.column_stack([
+            MAGNET_PATH_RADIUS * np.cos(coil_angles),
+            MAGNET_PATH_RADIUS * np.sin(coil_angles),
+            np.zeros(NUM_COILS),
+        ])
+        for i, (coil_angle, coil_pos) in enumerate(zip(coil_angles, coil_positions)):
             # Square coil matching magnet diameter
             coil = Rectangle(
                 width=MAGNET_RADIUS * 2.0,
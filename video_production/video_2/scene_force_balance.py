@@ -45,6 +45,24 @@ class ForceBalanceScene(Scene):
         PHASE_B = 2 * PI / 3
         PHASE_C = 4 * PI / 3
 
+        # 2-phase contrast: coil B moves to a 90 degree offset instead of 120
+        PHASE_B_2PHASE = PI / 2
+
+        # Arrow moves smaller than one rendered pixel are skipped
+        PIXEL_SIZE = config.frame_width / config.pixel_width
+
+        # Draft renders (-ql) step the rotating segments at 3 poses per second;
+        # every other quality keeps continuous linear motion
+        DRAFT_POSES_PER_SECOND = 3
+        IS_DRAFT = config.quality == "low_quality"
+
+        def spin_rate(run_time):
+            """Rate function for the constant-speed rotation plays."""
+            if not IS_DRAFT:
+                return linear
+            steps = DRAFT_POSES_PER_SECOND * run_time
+            return lambda x: round(x * steps) / steps
+
         # Coil positions (angular position from top, clockwise)
         COIL_A_ANGLE = PI / 2  # 12 o'clock (top)
         COIL_B_ANGLE = PI / 2 - 2 * PI / 3  # 4 o'clock
@@ -75,8 +93,71 @@ class ForceBalanceScene(Scene):
 
             Sum of these three = 0 at all times (they form a closed triangle).
             """
+            # Scalar math.cos/sin on plain floats; numpy ufunc dispatch on
+            # 0-d values costs more than the trig itself here
             angle = ROTATION_SPEED * t + phase_offset
-            return magnitude * np.array([np.cos(angle), np.sin(angle), 0])
+            return np.array([magnitude * math.cos(angle), magnitude * math.sin(angle), 0.0])
+
+        # All phases are evaluated together, one row each: A, B, C, 2-phase B
+        FRAME_PHASES = np.array([PHASE_A, PHASE_B, PHASE_C, PHASE_B_2PHASE])
+        IDX_A, IDX_B, IDX_C, IDX_B_2PHASE = range(len(FRAME_PHASES))
+
+        # Force vectors at t=0, used to lay the arrows out before any updater runs
+        INIT_VECS = MAX_FORCE_LENGTH * np.column_stack([
+            np.cos(FRAME_PHASES), np.sin(FRAME_PHASES), np.zeros(len(FRAME_PHASES))
+        ])
+
+        # Per-frame cache: every phase vector is computed once per time value
+        # and shared by all updaters that run in that frame. The arrays are
+        # allocated once and overwritten in place each frame (z stays 0).
+        frame_cache = {
+            "t": None,
+            "vecs": np.zeros((len(FRAME_PHASES), 3)),
+            "chain_2p": np.zeros((2, 3)),
+        }
+        angle_buf = np.empty(len(FRAME_PHASES))
+
+        def get_frame_vectors(t):
+            """
+            Force vectors for all phases at time t, refreshed once per time value.
+
+            Returns the cache dict:
+            - vecs: (4, 3) array, rows indexed by IDX_A/IDX_B/IDX_C/IDX_B_2PHASE
+            - chain_2p: running tip-to-tail sums of A, 2-phase B (last row = net force)
+            """
+            if t != frame_cache["t"]:
+                vecs = frame_cache["vecs"]
+                chain_2p = frame_cache["chain_2p"]
+                np.add(FRAME_PHASES, ROTATION_SPEED * t, out=angle_buf)
+                np.cos(angle_buf, out=vecs[:, 0])
+                np.sin(angle_buf, out=vecs[:, 1])
+                vecs[:, :2] *= MAX_FORCE_LENGTH
+                chain_2p[0] = vecs[IDX_A]
+                np.add(vecs[IDX_A], vecs[IDX_B_2PHASE], out=chain_2p[1])
+                frame_cache["t"] = t
+            return frame_cache
+
+        def place_arrow(arrow, start, vec):
+            """
+            Point an arrow from `start` along `vec` without changing its length.
+
+            Every force arrow keeps a constant length once placed, so a rigid
+            rotate + shift is enough. put_start_and_end_on also rescales, and
+            Arrow.scale pops and re-attaches the tip on every call.
+
+            Moves that would shift the tip by less than a pixel are skipped.
+            The delta is always measured from the arrow's current geometry,
+            so skipped frames never accumulate into drift.
+            """
+            curr_start, curr_end = arrow.get_start_and_end()
+            curr_vec = curr_end - curr_start
+            angle = (angle_of_vector(vec) - angle_of_vector(curr_vec) + PI) % TAU - PI
+            shift = start - curr_start
+            if abs(angle) * np.linalg.norm(curr_vec) >= PIXEL_SIZE:
+                arrow.rotate(angle, about_point=curr_start)
+            if np.abs(shift).max() >= PIXEL_SIZE:
+                arrow.shift(shift)
+            return arrow
 
         # ============================================================
         # VISUAL ELEMENTS - GENERATOR
@@ -93,11 +174,12 @@ class ForceBalanceScene(Scene):
         center_dot = Dot(ORIGIN, color=WHITE, radius=0.08)
 
         # Coils at 120 degree positions
-        coil_positions = [
-            np.array([GENERATOR_RADIUS * np.cos(COIL_A_ANGLE), GENERATOR_RADIUS * np.sin(COIL_A_ANGLE), 0]),
-            np.array([GENERATOR_RADIUS * np.cos(COIL_B_ANGLE), GENERATOR_RADIUS * np.sin(COIL_B_ANGLE), 0]),
-            np.array([GENERATOR_RADIUS * np.cos(COIL_C_ANGLE), GENERATOR_RADIUS * np.sin(COIL_C_ANGLE), 0]),
-        ]
+        coil_angles = np.array([COIL_A_ANGLE, COIL_B_ANGLE, COIL_C_ANGLE])
+        coil_positions = np.column_stack([
+            GENERATOR_RADIUS * np.cos(coil_angles),
+            GENERATOR_RADIUS * np.sin(coil_angles),
+            np.zeros(3),
+        ])
 
         coil_a = Circle(radius=COIL_RADIUS, color=COLOR_A, stroke_width=4, fill_opacity=0.3, fill_color=COLOR_A)
         coil_a.move_to(coil_positions[0])
@@ -120,29 +202,38 @@ class ForceBalanceScene(Scene):
         # ============================================================
         time_tracker = ValueTracker(0)
 
+        # Every force arrow has the same length and style: build the Arrow (and its
+        # tip geometry) once at full length and copy it. Built at MAX_FORCE_LENGTH
+        # so the tip size matches a freshly constructed arrow of that length.
+        force_arrow_template = Arrow(
+            ORIGIN,
+            RIGHT * MAX_FORCE_LENGTH,
+            buff=0,
+            stroke_width=6,
+            max_tip_length_to_length_ratio=0.25
+        )
+
         # Create arrows with updaters - all have EQUAL magnitude, different phase
-        def create_force_arrow(phase_offset, color):
+        def create_force_arrow(phase_index, color):
             """Create an arrow that ROTATES based on time."""
-            arrow = Arrow(
-                start=gen_center,
-                end=gen_center + get_rotating_force_vector(0, phase_offset, MAX_FORCE_LENGTH),
-                color=color,
-                buff=0,
-                stroke_width=6,
-                max_tip_length_to_length_ratio=0.25
-            )
-            arrow.phase_offset = phase_offset
-            return arrow
+            arrow = force_arrow_template.copy().set_color(color)
+            return place_arrow(arrow, gen_center, INIT_VECS[phase_index])
 
-        arrow_a = create_force_arrow(PHASE_A, COLOR_A)
-        arrow_b = create_force_arrow(PHASE_B, COLOR_B)
-        arrow_c = create_force_arrow(PHASE_C, COLOR_C)
+        arrow_a = create_force_arrow(IDX_A, COLOR_A)
+        arrow_b = create_force_arrow(IDX_B, COLOR_B)
+        arrow_c = create_force_arrow(IDX_C, COLOR_C)
 
-        def update_arrow(arrow):
-            t = time_tracker.get_value()
-            # Vector ROTATES with time (direction changes, magnitude constant)
-            vec = get_rotating_force_vector(t, arrow.phase_offset, MAX_FORCE_LENGTH)
-            arrow.put_start_and_end_on(gen_center, gen_center + vec)
+        def make_arrow_updater(phase_index):
+            """Bind the phase row in a closure so the per-frame call skips attribute lookups."""
+            def update_arrow(arrow):
+                # Vector ROTATES with time (direction changes, magnitude constant)
+                frame = get_frame_vectors(time_tracker.get_value())
+                place_arrow(arrow, gen_center, frame["vecs"][phase_index])
+            return update_arrow
+
+        update_arrow_a = make_arrow_updater(IDX_A)
+        update_arrow_b = make_arrow_updater(IDX_B)
+        update_arrow_c = make_arrow_updater(IDX_C)
 
         # ============================================================
         # TIP-TO-TAIL TRIANGLE (right side)
@@ -159,9 +250,7 @@ class ForceBalanceScene(Scene):
             t = time_tracker.get_value()
 
             # Get ROTATING force vectors (equal magnitude, 120 degrees apart)
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            vec_b = get_rotating_force_vector(t, PHASE_B, MAX_FORCE_LENGTH)
-            vec_c = get_rotating_force_vector(t, PHASE_C, MAX_FORCE_LENGTH)
+            vec_a, vec_b, vec_c = get_frame_vectors(t)["vecs"][[IDX_A, IDX_B, IDX_C]]
 
             # Tip-to-tail arrangement starting from triangle_center
             # These three vectors ALWAYS sum to zero, forming a closed triangle
@@ -179,30 +268,6 @@ class ForceBalanceScene(Scene):
             triangle_arrow_b.put_start_and_end_on(start_b, end_b)
             triangle_arrow_c.put_start_and_end_on(start_c, end_c)
 
-        def updater_triangle_a(mob):
-            t = time_tracker.get_value()
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            start_a = triangle_center
-            end_a = start_a + vec_a
-            mob.put_start_and_end_on(start_a, end_a)
-
-        def updater_triangle_b(mob):
-            t = time_tracker.get_value()
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            vec_b = get_rotating_force_vector(t, PHASE_B, MAX_FORCE_LENGTH)
-            start_b = triangle_center + vec_a
-            end_b = start_b + vec_b
-            mob.put_start_and_end_on(start_b, end_b)
-
-        def updater_triangle_c(mob):
-            t = time_tracker.get_value()
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            vec_b = get_rotating_force_vector(t, PHASE_B, MAX_FORCE_LENGTH)
-            vec_c = get_rotating_force_vector(t, PHASE_C, MAX_FORCE_LENGTH)
-            start_c = triangle_center + vec_a + vec_b
-            end_c = start_c + vec_c
-            mob.put_start_and_end_on(start_c, end_c)
-
         # Net force indicator (should stay at origin of triangle)
         net_force_dot = Dot(triangle_center, color=YELLOW, radius=0.12)
         net_force_label = Text("Net Force = 0", font_size=24, color=YELLOW)
@@ -214,13 +279,15 @@ class ForceBalanceScene(Scene):
         # ============================================================
         # ANIMATION SEQUENCE
         # ============================================================
-
         # 1. Show generator with coils
-        self.play(Create(generator_circle), FadeIn(center_dot), run_time=1)
         self.play(
-            Create(coil_a), Create(coil_b), Create(coil_c),
-            FadeIn(label_a), FadeIn(label_b), FadeIn(label_c),
-            run_time=1.5
+            AnimationGroup(
+                Create(generator_circle), FadeIn(center_dot),
+                Create(coil_a), Create(coil_b), Create(coil_c),
+                FadeIn(label_a), FadeIn(label_b), FadeIn(label_c),
+                lag_ratio=0.15
+            ),
+            run_time=2.5
         )
         self.wait(0.5)
 
@@ -234,15 +301,15 @@ class ForceBalanceScene(Scene):
         self.wait(0.5)
 
         # 3. Animate vectors pulsing (add updaters and run time)
-        arrow_a.add_updater(update_arrow)
-        arrow_b.add_updater(update_arrow)
-        arrow_c.add_updater(update_arrow)
+        arrow_a.add_updater(update_arrow_a)
+        arrow_b.add_updater(update_arrow_b)
+        arrow_c.add_updater(update_arrow_c)
 
         # Show pulsing for 2 cycles
         self.play(
             time_tracker.animate.set_value(4 * PI / ROTATION_SPEED),
             run_time=4,
-            rate_func=linear
+            rate_func=spin_rate(4)
         )
         self.wait(0.5)
 
@@ -265,9 +332,9 @@ class ForceBalanceScene(Scene):
         vec_b = get_rotating_force_vector(t_current, PHASE_B, MAX_FORCE_LENGTH)
         vec_c = get_rotating_force_vector(t_current, PHASE_C, MAX_FORCE_LENGTH)
 
-        target_a = Arrow(triangle_center, triangle_center + vec_a, color=COLOR_A, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.25)
-        target_b = Arrow(triangle_center + vec_a, triangle_center + vec_a + vec_b, color=COLOR_B, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.25)
-        target_c = Arrow(triangle_center + vec_a + vec_b, triangle_center + vec_a + vec_b + vec_c, color=COLOR_C, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.25)
+        target_a = place_arrow(force_arrow_template.copy().set_color(COLOR_A), triangle_center, vec_a)
+        target_b = place_arrow(force_arrow_template.copy().set_color(COLOR_B), triangle_center + vec_a, vec_b)
+        target_c = place_arrow(force_arrow_template.copy().set_color(COLOR_C), triangle_center + vec_a + vec_b, vec_c)
 
         self.play(
             Transform(arrow_a_copy, target_a),
@@ -276,18 +343,13 @@ class ForceBalanceScene(Scene):
             run_time=1.5
         )
 
-        # Remove copies and add the updater-based triangle arrows
+        # Remove copies and add the triangle arrows
         self.remove(arrow_a_copy, arrow_b_copy, arrow_c_copy)
         self.add(triangle_arrow_a, triangle_arrow_b, triangle_arrow_c)
 
         # Initialize positions
         update_triangle_arrows()
 
-        # Add updaters to triangle arrows
-        triangle_arrow_a.add_updater(updater_triangle_a)
-        triangle_arrow_b.add_updater(updater_triangle_b)
-        triangle_arrow_c.add_updater(updater_triangle_c)
-
         # 5. Show that triangle closes perfectly - net force = 0
         self.play(
             FadeIn(net_force_dot),
@@ -296,10 +358,24 @@ class ForceBalanceScene(Scene):
         )
 
         # Let it run showing the closed triangle rotating
+        # All three vectors turn together, so the whole configuration is a rigid
+        # rotation: the triangle about its first tail, the sources about the hub.
+        # The tracker still advances so the 2-phase section continues from here.
+        arrow_a.remove_updater(update_arrow_a)
+        arrow_b.remove_updater(update_arrow_b)
+        arrow_c.remove_updater(update_arrow_c)
         self.play(
             time_tracker.animate.set_value(time_tracker.get_value() + 6 * PI / ROTATION_SPEED),
+            *[
+                Rotating(arrow, radians=6 * PI, about_point=triangle_center, run_time=6)
+                for arrow in (triangle_arrow_a, triangle_arrow_b, triangle_arrow_c)
+            ],
+            *[
+                Rotating(arrow, radians=6 * PI, about_point=gen_center, run_time=6)
+                for arrow in (arrow_a, arrow_b, arrow_c)
+            ],
             run_time=6,
-            rate_func=linear
+            rate_func=spin_rate(6)
         )
 
         self.wait(1)
@@ -310,13 +386,6 @@ class ForceBalanceScene(Scene):
         # Show that 2-phase does NOT close
 
         # Remove 3-phase elements
-        triangle_arrow_a.remove_updater(updater_triangle_a)
-        triangle_arrow_b.remove_updater(updater_triangle_b)
-        triangle_arrow_c.remove_updater(updater_triangle_c)
-        arrow_a.remove_updater(update_arrow)
-        arrow_b.remove_updater(update_arrow)
-        arrow_c.remove_updater(update_arrow)
-
         three_phase_group = VGroup(
             triangle_arrow_a, triangle_arrow_b, triangle_arrow_c,
             net_force_dot, net_force_label, triangle_title
@@ -333,10 +402,9 @@ class ForceBalanceScene(Scene):
             run_time=1
         )
 
-        # 2-phase: Two rotating vectors 90 degrees apart
+        # 2-phase: Two rotating vectors 90 degrees apart (PHASE_B_2PHASE)
         # Sum of two unit vectors at 90 degrees = sqrt(2) at 45 degrees between them
         # This creates a NET FORCE that rotates (not zero!)
-        PHASE_B_2PHASE = PI / 2  # 90 degree offset
 
         # Move coil B to 3 o'clock position (visual indicator)
         new_b_pos = gen_center + np.array([GENERATOR_RADIUS, 0, 0])
@@ -346,9 +414,6 @@ class ForceBalanceScene(Scene):
             run_time=1
         )
 
-        # Update arrow_b phase for 2-phase (90 degrees offset instead of 120)
-        arrow_b.phase_offset = PHASE_B_2PHASE
-
         # Create 2-phase triangle arrows
         two_phase_arrow_a = Arrow(ORIGIN, ORIGIN, color=COLOR_A, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.25)
         two_phase_arrow_b = Arrow(ORIGIN, ORIGIN, color=COLOR_B, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.25)
@@ -357,47 +422,27 @@ class ForceBalanceScene(Scene):
         net_force_arrow = Arrow(ORIGIN, ORIGIN, color=RED, buff=0, stroke_width=8, max_tip_length_to_length_ratio=0.3)
 
         def updater_2phase_a(mob):
-            t = time_tracker.get_value()
             # Rotating vector A (phase 0)
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            start_a = triangle_center
-            end_a = start_a + vec_a
-            mob.put_start_and_end_on(start_a, end_a)
+            frame = get_frame_vectors(time_tracker.get_value())
+            place_arrow(mob, triangle_center, frame["vecs"][IDX_A])
 
         def updater_2phase_b(mob):
-            t = time_tracker.get_value()
             # Rotating vectors for tip-to-tail
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            vec_b = get_rotating_force_vector(t, PHASE_B_2PHASE, MAX_FORCE_LENGTH)
-            start_b = triangle_center + vec_a
-            end_b = start_b + vec_b
-            mob.put_start_and_end_on(start_b, end_b)
+            frame = get_frame_vectors(time_tracker.get_value())
+            place_arrow(mob, triangle_center + frame["chain_2p"][0], frame["vecs"][IDX_B_2PHASE])
 
         def updater_net_force(mob):
-            t = time_tracker.get_value()
-            # Sum of two rotating vectors 90 degrees apart = non-zero rotating vector
-            vec_a = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            vec_b = get_rotating_force_vector(t, PHASE_B_2PHASE, MAX_FORCE_LENGTH)
-            net = vec_a + vec_b
-            # Net force is NOT zero - it rotates with magnitude sqrt(2) * MAX_FORCE_LENGTH
-            mob.put_start_and_end_on(triangle_center, triangle_center + net)
-
-        def updater_arrow_a_2phase(mob):
-            t = time_tracker.get_value()
-            vec = get_rotating_force_vector(t, PHASE_A, MAX_FORCE_LENGTH)
-            mob.put_start_and_end_on(gen_center, gen_center + vec)
-
-        def updater_arrow_b_2phase(mob):
-            t = time_tracker.get_value()
-            vec = get_rotating_force_vector(t, PHASE_B_2PHASE, MAX_FORCE_LENGTH)
-            mob.put_start_and_end_on(gen_center, gen_center + vec)
+            # Sum of two rotating vectors 90 degrees apart = non-zero rotating vector:
+            #   F_A + F_B = sqrt(2) * MAX_FORCE_LENGTH * (cos(wt + pi/4), sin(wt + pi/4))
+            # The cached chain already holds that sum (one vector add, no extra
+            # trig), and its length never changes, so place_arrow only rotates it
+            frame = get_frame_vectors(time_tracker.get_value())
+            place_arrow(mob, triangle_center, frame["chain_2p"][1])
 
         # Add updaters
         two_phase_arrow_a.add_updater(updater_2phase_a)
         two_phase_arrow_b.add_updater(updater_2phase_b)
         net_force_arrow.add_updater(updater_net_force)
-        arrow_a.add_updater(updater_arrow_a_2phase)
-        arrow_b.add_updater(updater_arrow_b_2phase)
 
         # Initialize positions
         t_current = time_tracker.get_value()
@@ -407,6 +452,10 @@ class ForceBalanceScene(Scene):
         two_phase_arrow_b.put_start_and_end_on(triangle_center + vec_a, triangle_center + vec_a + vec_b)
         net_force_arrow.put_start_and_end_on(triangle_center, triangle_center + vec_a + vec_b)
 
+        # Swing arrow_b to its 2-phase direction (90 degrees offset instead of 120);
+        # from here the source arrows just spin, driven by Rotating below
+        place_arrow(arrow_b, gen_center, vec_b)
+
         net_wobble_label = Text("Net Force ROTATES (not zero!)", font_size=20, color=RED)
         net_wobble_label.next_to(triangle_center, DOWN, buff=1.5)
 
@@ -414,10 +463,15 @@ class ForceBalanceScene(Scene):
         self.play(FadeIn(net_wobble_label), run_time=0.5)
 
         # Run 2-phase animation showing wobble
+        # Source arrows turn 4*PI in the same 4s the tracker advances. Rotating
+        # rotates a saved copy by rate_func(alpha) * radians each frame, so the
+        # arrows follow the same rate function as the tracker
         self.play(
             time_tracker.animate.set_value(time_tracker.get_value() + 4 * PI / ROTATION_SPEED),
+            Rotating(arrow_a, radians=4 * PI, about_point=gen_center, run_time=4),
+            Rotating(arrow_b, radians=4 * PI, about_point=gen_center, run_time=4),
             run_time=4,
-            rate_func=linear
+            rate_func=spin_rate(4)
         )
 
         self.wait(1)
@@ -116,22 +116,11 @@ class LinearToCircularScene(Scene):
         NORTH_ANGLE = PI      # 9 o'clock
         SOUTH_ANGLE = 0       # 3 o'clock
 
-        coil_circle_pos = CIRCLE_CENTER + np.array([
-            MAGNET_PATH_RADIUS * np.cos(COIL_ANGLE),
-            MAGNET_PATH_RADIUS * np.sin(COIL_ANGLE),
-            0
-        ])
-
-        north_circle_pos = CIRCLE_CENTER + np.array([
-            MAGNET_PATH_RADIUS * np.cos(NORTH_ANGLE),
-            MAGNET_PATH_RADIUS * np.sin(NORTH_ANGLE),
-            0
-        ])
-
-        south_circle_pos = CIRCLE_CENTER + np.array([
-            MAGNET_PATH_RADIUS * np.cos(SOUTH_ANGLE),
-            MAGNET_PATH_RADIUS * np.sin(SOUTH_ANGLE),
-            0
+        target_angles = np.array([COIL_ANGLE, NORTH_ANGLE, SOUTH_ANGLE])
+        coil_circle_pos, north_circle_pos, south_circle_pos = CIRCLE_CENTER + np.column_stack([
+            MAGNET_PATH_RADIUS * np.cos(target_angles),
+            MAGNET_PATH_RADIUS * np.sin(target_angles),
+            np.zeros(3),
         ])
 
         # ============================================================
@@ -140,8 +129,10 @@ class LinearToCircularScene(Scene):
 
         # Phase 1: Show linear track setup
         self.add(track)
-        self.play(FadeIn(coil), run_time=0.5)
-        self.play(FadeIn(magnets_group), run_time=0.5)
+        self.play(
+            AnimationGroup(FadeIn(coil), FadeIn(magnets_group), lag_ratio=1),
+            run_time=1.0
+        )
         self.wait(0.5)
 
         # Phase 2: Magnets move across (left to right)
@@ -1,5 +1,5 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace
+from generator import axes_points, build_rotor, calculate_sine_voltage_trace, grow_trace_curve
 import math
 from dataclasses import dataclass
 import numpy as np
@@ -57,63 +57,67 @@ class MagnetComparisonScene(Scene):
         # ============================================================
         print("MagnetComparison: Calculating physics...")
 
-        # Data for 1 magnet configuration
-        one_magnet_data = {}
-        for coil_cfg in coils_config:
-            coil_angle_static = (PI / 2.0) - coil_cfg["position_offset"]
-            voltage_trace = calculate_sine_voltage_trace(
-                num_magnets=1,
+        # Flux depends only on (magnet angle - coil angle), so a coil further
+        # clockwise sees the same waveform as the one before it, just later in
+        # time. Simulate the most-lagging coil once per magnet count over a
+        # longer window and read every other coil out of it with an index shift.
+        max_offset = max(coil_cfg["position_offset"] for coil_cfg in coils_config)
+        lead_steps = {
+            coil_cfg["name"]: round((max_offset - coil_cfg["position_offset"]) / ROTATION_SPEED / dt)
+            for coil_cfg in coils_config
+        }
+        max_lead = max(lead_steps.values())
+
+        def calculate_coil_traces(num_magnets):
+            reference = calculate_sine_voltage_trace(
+                num_magnets=num_magnets,
                 rotation_speed=ROTATION_SPEED,
-                total_time=SIMULATION_TIME,
-                coil_angle_static=coil_angle_static,
+                total_time=(PHYSICS_STEPS + max_lead) * dt,
+                coil_angle_static=(PI / 2.0) - max_offset,
                 amplitude=10.0,
-                steps=PHYSICS_STEPS,
+                steps=PHYSICS_STEPS + max_lead,
             )
-            one_magnet_data[coil_cfg["name"]] = voltage_trace
-            print(f"  1 magnet - Coil {coil_cfg['name']}: {len(voltage_trace)} points")
+            traces = {}
+            for name, lead in lead_steps.items():
+                trace = reference[lead:lead + PHYSICS_STEPS].copy()
+                trace[:, 0] = reference[:PHYSICS_STEPS, 0]
+                traces[name] = trace
+            return traces
+
+        # Data for 1 magnet configuration
+        one_magnet_data = calculate_coil_traces(1)
+        for name, trace in one_magnet_data.items():
+            print(f"  1 magnet - Coil {name}: {len(trace)} points")
 
         # Data for 2 magnet configuration
-        two_magnet_data = {}
-        for coil_cfg in coils_config:
-            coil_angle_static = (PI / 2.0) - coil_cfg["position_offset"]
-            voltage_trace = calculate_sine_voltage_trace(
-                num_magnets=2,
-                rotation_speed=ROTATION_SPEED,
-                total_time=SIMULATION_TIME,
-                coil_angle_static=coil_angle_static,
-                amplitude=10.0,
-                steps=PHYSICS_STEPS,
-            )
-            two_magnet_data[coil_cfg["name"]] = voltage_trace
-            print(f"  2 magnets - Coil {coil_cfg['name']}: {len(voltage_trace)} points")
+        two_magnet_data = calculate_coil_traces(2)
+        for name, trace in two_magnet_data.items():
+            print(f"  2 magnets - Coil {name}: {len(trace)} points")
 
         # Find max voltage for graph scaling (use both configurations)
-        max_voltage = 0.0
-        for trace in list(one_magnet_data.values()) + list(two_magnet_data.values()):
-            for _, v in trace:
-                max_voltage = max(max_voltage, abs(v))
-        max_voltage *= 1.1
+        all_voltages = np.concatenate([
+            trace[:, 1] for trace in list(one_magnet_data.values()) + list(two_magnet_data.values())
+        ])
+        max_voltage = 1.1 * np.abs(all_voltages).max()
 
         # ============================================================
-        # HELPER FUNCTION: Build square coil
+        # HELPER FUNCTION: Build square coils
         # ============================================================
-        def build_square_coil(coil_angle, coil_color, path_radius, magnet_radius):
-            """Build a square coil at the given angle position."""
-            pos = np.array([
-                path_radius * math.cos(coil_angle),
-                path_radius * math.sin(coil_angle),
-                0
+        def build_square_coils(coil_angles, coil_colors, path_radius, magnet_radius):
+            """Build one square coil per angle position, all from a single template."""
+            positions = path_radius * np.column_stack([
+                np.cos(coil_angles), np.sin(coil_angles), np.zeros(len(coil_angles))
             ])
             # Coil size matches magnet diameter to capture full flux
-            coil = Rectangle(
+            coil_template = Rectangle(
                 width=magnet_radius * 2.0,
                 height=magnet_radius * 2.0,
-                color=coil_color,
                 stroke_width=6
             )
-            coil.rotate(coil_angle - PI/2)
-            coil.move_to(pos)
-            return coil
+            return [
+                coil_template.copy().set_color(color).rotate(angle - PI/2).move_to(pos)
+                for angle, color, pos in zip(coil_angles, coil_colors, positions)
+            ]
 
         # ============================================================
         # VISUAL ELEMENTS - GENERATOR (Left side)
@@ -142,9 +146,12 @@ class MagnetComparisonScene(Scene):
         coil_mobjects = VGroup()
         coil_labels = VGroup()
 
-        for coil_cfg in coils_config:
-            angle = (PI / 2.0) - coil_cfg["position_offset"]
-            coil = build_square_coil(angle, coil_cfg["color"], MAGNET_PATH_RADIUS, MAGNET_RADIUS)
+        coil_angles = (PI / 2.0) - np.array([coil_cfg["position_offset"] for coil_cfg in coils_config])
+        coils = build_square_coils(
+            coil_angles, [coil_cfg["color"] for coil_cfg in coils_config], MAGNET_PATH_RADIUS, MAGNET_RADIUS
+        )
+
+        for coil_cfg, coil in zip(coils_config, coils):
             label = Text(coil_cfg["name"], font_size=28, color=coil_cfg["color"]).next_to(coil, UP, buff=0.15)
             coil_mobjects.add(coil)
             coil_labels.add(label)
@@ -175,6 +182,9 @@ class MagnetComparisonScene(Scene):
 
         disk_center = rotor_1_magnet.get_center()
 
+        # Smallest rotor turn that moves the disk rim by one rendered pixel
+        min_rotor_angle = (config.frame_width / config.pixel_width) / (rotor_1_magnet.width / 2)
+
         # Generator group for reference (positioning magnet label)
         generator_group = VGroup(stator, rotor_1_magnet, coil_mobjects, coil_labels)
 
@@ -224,85 +234,59 @@ class MagnetComparisonScene(Scene):
         curve_b = VMobject().set_color(ORANGE).set_stroke(width=2.5)
         curves = VGroup(curve_a, curve_b)
 
+        # Map every trace to scene points once; the updaters only slice them
+        coil_axes = {"A": ax_coil_a, "B": ax_coil_b}
+
+        def trace_points(data):
+            points = {}
+            for name, trace in data.items():
+                points[name] = axes_points(coil_axes[name], trace[:, 0], trace[:, 1])
+            return points
+
+        one_magnet_points = trace_points(one_magnet_data)
+        two_magnet_points = trace_points(two_magnet_data)
+
         # Store current data source (will be swapped during transition)
-        current_data = {"A": one_magnet_data["A"], "B": one_magnet_data["B"]}
+        current_points = dict(one_magnet_points)
 
         # ============================================================
         # UPDATERS
         # ============================================================
         time_tracker = ValueTracker(0)
 
+        def make_rotor_updater(last_t):
+            """Rotor updater that turns its rotor by the sim time elapsed since last_t[0]."""
+            def update_rotor(mob, dt):
+                t_now = time_tracker.get_value()
+                dt_sim = t_now - last_t[0]
+                # Sub-pixel turns are held back; last_t stays put, so they add up
+                # and are applied together once they become visible
+                if abs(ROTATION_SPEED * dt_sim) >= min_rotor_angle:
+                    mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center)
+                    last_t[0] = t_now
+            return update_rotor
+
         # Rotor rotation updater for 1-magnet rotor
         last_t_1 = [0.0]
-
-        def update_rotor_1(mob, dt):
-            t_now = time_tracker.get_value()
-            dt_sim = t_now - last_t_1[0]
-            if dt_sim != 0:
-                mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center)
-                last_t_1[0] = t_now
-
+        update_rotor_1 = make_rotor_updater(last_t_1)
         rotor_1_magnet.add_updater(update_rotor_1)
 
         # Rotor rotation updater for 2-magnet rotor
         last_t_2 = [0.0]
+        update_rotor_2 = make_rotor_updater(last_t_2)
 
-        def update_rotor_2(mob, dt):
-            t_now = time_tracker.get_value()
-            dt_sim = t_now - last_t_2[0]
-            if dt_sim != 0:
-                mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center)
-                last_t_2[0] = t_now
-
-        # Curve updater for Coil A
-        def update_curve_a(mob):
-            t_now = time_tracker.get_value()
-            trace = current_data["A"]
-
-            idx_end = int(t_now / dt)
-            idx_end = min(len(trace) - 1, max(0, idx_end))
-
-            visible = trace[0:idx_end + 1]
-
-            SUBSAMPLE_RATE = 3
-            visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-            if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                visible_subsampled.append(visible[-1])
-
-            points = [ax_coil_a.c2p(t_val, v_val) for t_val, v_val in visible_subsampled]
+        # Last sample index drawn on each curve, so frames only append new segments
+        drawn_a = [-1]
+        drawn_b = [-1]
 
-            if len(points) > 1:
-                mob.set_points_as_corners(points)
-            elif len(points) == 1:
-                mob.set_points_as_corners([points[0], points[0]])
-
-        curve_a.add_updater(update_curve_a)
-
-        # Curve updater for Coil B
-        def update_curve_b(mob):
+        # Both curves follow the same tracker, so one scene updater reads it once
+        # per frame and grows Coil A and Coil B together
+        def update_curves(frame_dt):
             t_now = time_tracker.get_value()
-            trace = current_data["B"]
-
-            idx_end = int(t_now / dt)
-            idx_end = min(len(trace) - 1, max(0, idx_end))
-
-            visible = trace[0:idx_end + 1]
-
-            SUBSAMPLE_RATE = 3
-            visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-            if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                visible_subsampled.append(visible[-1])
-
-            points = [ax_coil_b.c2p(t_val, v_val) for t_val, v_val in visible_subsampled]
-
-            if len(points) > 1:
-                mob.set_points_as_corners(points)
-            elif len(points) == 1:
-                mob.set_points_as_corners([points[0], points[0]])
+            grow_trace_curve(curve_a, current_points["A"], t_now, dt, drawn_a)
+            grow_trace_curve(curve_b, current_points["B"], t_now, dt, drawn_b)
 
-        curve_b.add_updater(update_curve_b)
+        self.add_updater(update_curves)
 
         # ============================================================
         # ANIMATION SEQUENCE
@@ -329,8 +313,7 @@ class MagnetComparisonScene(Scene):
 
         # Transition: Fade out 1-magnet, fade in 2-magnets, clear graphs
         rotor_1_magnet.remove_updater(update_rotor_1)
-        curve_a.remove_updater(update_curve_a)
-        curve_b.remove_updater(update_curve_b)
+        self.remove_updater(update_curves)
 
         # Reset time tracker
         time_tracker.set_value(0)
@@ -339,10 +322,11 @@ class MagnetComparisonScene(Scene):
         # Clear curves
         curve_a.set_points_as_corners([ax_coil_a.c2p(0, 0), ax_coil_a.c2p(0, 0)])
         curve_b.set_points_as_corners([ax_coil_b.c2p(0, 0), ax_coil_b.c2p(0, 0)])
+        drawn_a[0] = -1
+        drawn_b[0] = -1
 
         # Update data source to 2-magnet data
-        current_data["A"] = two_magnet_data["A"]
-        current_data["B"] = two_magnet_data["B"]
+        current_points.update(two_magnet_points)
 
         # Update label
         new_magnet_label = Text("2 Magnets", font_size=28, color=WHITE)
@@ -356,7 +340,8 @@ class MagnetComparisonScene(Scene):
         self.play(
             FadeOut(rotor_1_magnet),
             FadeIn(rotor_2_magnets),
-            Transform(magnet_label, new_magnet_label),
+            FadeOut(magnet_label),
+            FadeIn(new_magnet_label),
             run_time=1.0
         )
 
@@ -369,8 +354,7 @@ class MagnetComparisonScene(Scene):
 
         # Re-add updaters for phase 2
         rotor_2_magnets.add_updater(update_rotor_2)
-        curve_a.add_updater(update_curve_a)
-        curve_b.add_updater(update_curve_b)
+        self.add_updater(update_curves)
 
         # Phase 2: 2 magnets (5.5 seconds)
         self.play(
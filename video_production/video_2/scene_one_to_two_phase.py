@@ -1,5 +1,5 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace
+from generator import axes_points, build_rotor, calculate_sine_voltage_trace, grow_trace_curve
 import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
@@ -62,22 +62,19 @@ class OneToTwoPhaseScene(Scene):
         # COIL MOTION PROFILES
         # ============================================================
 
+        # Profiles accept a single time or a whole array of times
+
         def stationary_profile(t):
             """Coil A stays at 12 o'clock"""
-            return 0.0
+            return 0.0 * t
 
         def phase_b_profile(t):
             """Phase B: starts at 12 o'clock, moves to 3 o'clock (90 degrees) between t=3 and t=6"""
-            if t < MOVE_START:
-                return 0.0
-            elif t < MOVE_END:
-                # Smooth interpolation using smooth_step (ease in/out)
-                alpha = (t - MOVE_START) / MOVE_DURATION
-                # Use smoothstep for nice easing: 3x^2 - 2x^3
-                smooth_alpha = alpha * alpha * (3 - 2 * alpha)
-                return smooth_alpha * TARGET_OFFSET
-            else:
-                return TARGET_OFFSET
+            # Progress through the move, held at 0 before MOVE_START and 1 after MOVE_END
+            alpha = np.clip((t - MOVE_START) / MOVE_DURATION, 0.0, 1.0)
+            # Use smoothstep for nice easing: 3x^2 - 2x^3
+            smooth_alpha = alpha * alpha * (3 - 2 * alpha)
+            return smooth_alpha * TARGET_OFFSET
 
         # ============================================================
         # COIL CONFIGURATIONS
@@ -92,20 +89,17 @@ class OneToTwoPhaseScene(Scene):
         # ============================================================
         print(f"Calculating physics for {len(coils_config)} coil(s)...")
 
-        coil_data = {}  # coil_name -> List[(time, voltage)]
+        coil_data = {}  # coil_name -> (N, 2) array of (time, voltage)
 
-        for coil_cfg in coils_config:
-            def make_coil_angle_func(motion_profile):
-                def coil_angle_func(t):
-                    offset = motion_profile(t)
-                    return (PI / 2.0) - offset
-                return coil_angle_func
+        # Physics sample times, matching calculate_sine_voltage_trace
+        physics_times = np.arange(PHYSICS_STEPS) * dt
 
+        for coil_cfg in coils_config:
             voltage_trace = calculate_sine_voltage_trace(
                 num_magnets=NUM_MAGNETS,
                 rotation_speed=ROTATION_SPEED,
                 total_time=SIMULATION_TIME,
-                coil_angle_func=make_coil_angle_func(coil_cfg.motion_profile),
+                coil_angle_array=(PI / 2.0) - coil_cfg.motion_profile(physics_times),
                 amplitude=10.0,
                 steps=PHYSICS_STEPS,
             )
@@ -114,12 +108,8 @@ class OneToTwoPhaseScene(Scene):
             print(f"  Coil {coil_cfg.name}: {len(voltage_trace)} data points")
 
         # Find max voltage for graph scaling
-        max_voltage = 0.0
-        for trace in coil_data.values():
-            for _, v in trace:
-                max_voltage = max(max_voltage, abs(v))
-
-        max_voltage *= 1.1  # Add padding
+        all_voltages = np.concatenate([trace[:, 1] for trace in coil_data.values()])
+        max_voltage = 1.1 * np.abs(all_voltages).max()  # Add padding
 
         # ============================================================
         # VISUAL ELEMENTS
@@ -184,6 +174,9 @@ class OneToTwoPhaseScene(Scene):
         generator_group.to_edge(LEFT, buff=1.0)
         disk_center = rotor_group.get_center()
 
+        # Smallest rotor turn that moves the disk rim by one rendered pixel
+        min_rotor_angle = (config.frame_width / config.pixel_width) / (rotor_group.width / 2)
+
         # --- VOLTAGE GRAPH (Right side) ---
         voltage_ax = Axes(
             x_range=[0, SIMULATION_TIME, 1],
@@ -223,16 +216,22 @@ class OneToTwoPhaseScene(Scene):
             t_now = time_tracker.get_value()
             dt_sim = t_now - last_t[0]
 
-            if dt_sim != 0:
+            # Sub-pixel turns are held back; last_t stays put, so they add up
+            # and are applied together once they become visible
+            if abs(ROTATION_SPEED * dt_sim) >= min_rotor_angle:
                 mob.rotate(-ROTATION_SPEED * dt_sim, about_point=disk_center)
                 last_t[0] = t_now
 
         rotor_group.add_updater(update_rotor)
 
         # Coil position updaters
+        # Coils only move between MOVE_START and MOVE_END; outside that window
+        # the updaters return before evaluating the profile
         for coil in coil_mobjects:
             def update_coil_position(mob, profile=coil.motion_profile, start_angle=coil.current_angle):
                 t = time_tracker.get_value()
+                if t < MOVE_START or t > MOVE_END:
+                    return
                 offset = profile(t)
                 new_angle = (PI / 2.0) - offset
 
@@ -244,46 +243,31 @@ class OneToTwoPhaseScene(Scene):
             coil.add_updater(update_coil_position)
 
         # Label position updaters (follow coils)
+        coil_mobjects_by_name = {coil.coil_name: coil for coil in coil_mobjects}
         for label in coil_labels:
-            def update_label_position(mob, target_name=label.coil_name):
-                for coil in coil_mobjects:
-                    if coil.coil_name == target_name:
-                        mob.next_to(coil, UP, buff=0.15)
-                        break
+            def update_label_position(mob, target_coil=coil_mobjects_by_name[label.coil_name]):
+                t = time_tracker.get_value()
+                if t < MOVE_START or t > MOVE_END:
+                    return
+                mob.next_to(target_coil, UP, buff=0.15)
 
             label.add_updater(update_label_position)
 
         # Voltage curve updaters (ACCUMULATING from t=0)
-        for curve in curves:
-            def update_curve(mob, coil_name=curve.coil_name):
-                t_now = time_tracker.get_value()
-
-                trace = coil_data[coil_name]
-
-                idx_end = int(t_now / dt)
-                idx_end = min(len(trace) - 1, max(0, idx_end))
-
-                visible = trace[0:idx_end + 1]
-
-                SUBSAMPLE_RATE = 3
-                visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-                if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                    visible_subsampled.append(visible[-1])
-
-                points = []
-                for t_val, v_val in visible_subsampled:
-                    x_graph = t_val
-                    points.append(voltage_ax.c2p(x_graph, v_val))
-
-                if len(points) > 1:
-                    mob.set_points_as_corners(points)
-                elif len(points) == 1:
-                    mob.set_points_as_corners([points[0], points[0]])
-                else:
-                    mob.set_points_as_corners([])
+        # Traces are mapped to scene points once; the updaters only append the
+        # samples reached since the previous frame
+        coil_points = {}
+        for coil_name, trace in coil_data.items():
+            coil_points[coil_name] = axes_points(voltage_ax, trace[:, 0], trace[:, 1])
+        drawn = {coil_name: [-1] for coil_name in coil_points}
+
+        # One scene updater reads the tracker once per frame and grows every curve
+        def update_curves(frame_dt):
+            t_now = time_tracker.get_value()
+            for curve in curves:
+                grow_trace_curve(curve, coil_points[curve.coil_name], t_now, dt, drawn[curve.coil_name])
 
-            curve.add_updater(update_curve)
+        self.add_updater(update_curves)
 
         # ============================================================
         # ANIMATION SEQUENCE
@@ -1,9 +1,5 @@
 from manim import *
-from generator import (
-    build_rotor,
-    get_theta_distance,
-    get_area_between_circle
-)
+from generator import axes_points, build_rotor
 import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
@@ -49,10 +45,11 @@ class PhaseShiftScene(Scene):
         # ============================================================
         # Define how each coil moves over time
         # All coils start at 12 o'clock (top, PI/2)
+        # Profiles accept a single time or a whole array of times
 
         def stationary_profile(t):
             """Coil stays at 12 o'clock"""
-            return 0.0
+            return 0.0 * t
 
         def moving_1x_profile(t):
             """Coil moves to target position over 8 seconds"""
@@ -60,13 +57,9 @@ class PhaseShiftScene(Scene):
             MOVE_DURATION = 8.0
             TARGET_OFFSET = 90 * DEGREES  # clockwise from top (3 o'clock position)
 
-            if t < MOVE_START:
-                return 0.0
-            elif t < MOVE_START + MOVE_DURATION:
-                alpha = (t - MOVE_START) / MOVE_DURATION
-                return alpha * TARGET_OFFSET
-            else:
-                return TARGET_OFFSET
+            # Progress through the move, held at 0 before the start and 1 after the end
+            alpha = np.clip((t - MOVE_START) / MOVE_DURATION, 0.0, 1.0)
+            return alpha * TARGET_OFFSET
 
         def moving_2x_profile(t):
             """Coil moves twice as fast/far as 1x coil"""
@@ -96,39 +89,6 @@ class PhaseShiftScene(Scene):
         # ============================================================
         # PHYSICS CALCULATION
         # ============================================================
-        def calculate_flux_at_instant(t: float, coil_angle: float) -> float:
-            """
-            Calculate the magnetic flux through a coil at a specific time.
-
-            Args:
-                t: Current time (determines magnet positions)
-                coil_angle: Angular position of coil (radians, 0=right, PI/2=top)
-
-            Returns:
-                Total flux through the coil
-            """
-            # Magnets rotate clockwise (negative direction)
-            angle_delta = -ROTATION_SPEED * t
-
-            total_flux = 0.0
-            for i, start_angle in enumerate(magnet_angles_start):
-                # Current magnet position
-                current_mag_angle = (start_angle + angle_delta) % (2 * PI)
-
-                # Angular distance between coil and magnet
-                dist = get_theta_distance(coil_angle, current_mag_angle)
-
-                # Overlap area (proxy for flux)
-                area = get_area_between_circle(dist, MAGNET_PATH_RADIUS, MAGNET_RADIUS)
-
-                # Add or subtract based on polarity
-                if magnet_polarities[i]:
-                    total_flux += area
-                else:
-                    total_flux -= area
-
-            return total_flux
-
         # Pre-calculate physics data for ALL coils
         print(f"Calculating physics for {len(coils_config)} coil(s)...")
 
@@ -139,21 +99,32 @@ class PhaseShiftScene(Scene):
         import numpy as np
 
         lookup_steps = 5000  # High resolution lookup table
-        flux_lookup = []
 
-        for i in range(lookup_steps):
-            # Coil at top (PI/2), magnets at various angles
-            t_lookup = (i / lookup_steps) * (2 * PI / ROTATION_SPEED)
-            flux = calculate_flux_at_instant(t_lookup, PI / 2.0)
-            flux_lookup.append(flux)
+        # Coil at top (PI/2), every (magnet, sample) pair at once as a
+        # (NUM_MAGNETS, lookup_steps) grid; magnets rotate clockwise
+        t_lookup = np.arange(lookup_steps) * (2 * PI / ROTATION_SPEED / lookup_steps)
+        current_mag_angles = (
+            np.asarray(magnet_angles_start)[:, None] - ROTATION_SPEED * t_lookup[None, :]
+        ) % (2 * PI)
+
+        # Same model as get_theta_distance / get_area_between_circle, elementwise
+        abs_diff = np.abs((PI / 2.0) - current_mag_angles)
+        theta_dist = np.minimum(abs_diff, 2 * PI - abs_diff)
+        d = 2 * MAGNET_PATH_RADIUS * np.sin(theta_dist / 2.0)
+        r = MAGNET_RADIUS
+        term1 = 2 * (r**2) * np.arccos(np.clip(d / (2 * r), -1.0, 1.0))
+        term2 = 0.5 * d * np.sqrt(np.maximum(0, 4 * (r**2) - d**2))
+        area = np.where(d >= 2 * r, 0.0, term1 - term2)
+
+        # Add or subtract each magnet's overlap based on polarity
+        pol = np.where(magnet_polarities, 1.0, -1.0)
+        flux_lookup = pol @ area
 
         # Smooth the lookup table
         flux_lookup_smoothed = gaussian_filter1d(flux_lookup, sigma=50)
 
         def get_smoothed_flux_at_angle(t, coil_angle):
-            """Get smoothed flux for a coil at given angle at time t"""
-            # Calculate relative angle between coil and magnet(s)
-            angle_delta = -ROTATION_SPEED * t
+            """Get smoothed flux for a coil at given angle at time t (scalars or arrays)"""
             # We need the magnet angle relative to coil
             # Our lookup is for coil at PI/2, so adjust
             effective_time = t + (PI/2 - coil_angle) / ROTATION_SPEED
@@ -162,52 +133,41 @@ class PhaseShiftScene(Scene):
 
             # Use LINEAR INTERPOLATION instead of integer indexing to avoid discrete jumps
             fractional_idx = (phase / (2 * PI)) * lookup_steps
-            idx_low = int(fractional_idx) % lookup_steps
+            idx_floor = np.floor(fractional_idx)
+            idx_low = idx_floor.astype(int) % lookup_steps
             idx_high = (idx_low + 1) % lookup_steps
-            alpha = fractional_idx - int(fractional_idx)
+            alpha = fractional_idx - idx_floor
 
             # Interpolate between adjacent lookup table values
-            flux_low = flux_lookup_smoothed[idx_low]
-            flux_high = flux_lookup_smoothed[idx_high]
+            flux_low = np.take(flux_lookup_smoothed, idx_low)
+            flux_high = np.take(flux_lookup_smoothed, idx_high)
             return flux_low + alpha * (flux_high - flux_low)
 
         # STEP 2: Calculate voltage for each coil
-        coil_data = {}  # coil_name -> List[(time, voltage)]
-
-        for coil_cfg in coils_config:
-            voltage_trace = []
-
-            for step in range(PHYSICS_STEPS):
-                t = step * dt
-
-                # Get coil position at this time
-                offset = coil_cfg.motion_profile(t)
-                coil_angle = (PI / 2.0) - offset
+        coil_data = {}  # coil_name -> (N, 2) array of (time, voltage)
 
-                if step > 0:
-                    # Calculate voltage as if coil is stationary at current position
-                    # Flux now (with magnet at current position)
-                    flux_now = get_smoothed_flux_at_angle(t, coil_angle)
-
-                    # Flux dt ago (with magnet dt ago, coil at SAME position)
-                    flux_prev = get_smoothed_flux_at_angle(t - dt, coil_angle)
-
-                    voltage = (flux_now - flux_prev) / dt
-                else:
-                    voltage = 0.0
-
-                voltage_trace.append((t, voltage))
+        # Physics sample times, shared by every coil
+        ts = np.arange(PHYSICS_STEPS) * dt
 
+        for coil_cfg in coils_config:
+            # Coil position at every sample time
+            coil_angle = (PI / 2.0) - coil_cfg.motion_profile(ts)
+
+            # Calculate voltage as if coil is stationary at current position:
+            # flux now (magnet at current position) minus flux dt ago
+            # (magnet dt ago, coil at SAME position)
+            flux_now = get_smoothed_flux_at_angle(ts, coil_angle)
+            flux_prev = get_smoothed_flux_at_angle(ts - dt, coil_angle)
+            voltage = (flux_now - flux_prev) / dt
+            voltage[0] = 0.0
+
+            voltage_trace = np.column_stack([ts, voltage])
             coil_data[coil_cfg.name] = voltage_trace
             print(f"  Coil {coil_cfg.name}: {len(voltage_trace)} data points")
 
         # Find max voltage for graph scaling
-        max_voltage = 0.0
-        for trace in coil_data.values():
-            for _, v in trace:
-                max_voltage = max(max_voltage, abs(v))
-
-        max_voltage *= 1.1  # Add padding
+        all_voltages = np.concatenate([trace[:, 1] for trace in coil_data.values()])
+        max_voltage = 1.1 * np.abs(all_voltages).max()  # Add padding
 
         # ============================================================
         # VISUAL ELEMENTS
@@ -350,15 +310,16 @@ class PhaseShiftScene(Scene):
 
                 # Always include the last point for accuracy at the edge
                 if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                    visible_subsampled.append(visible[-1])
+                    visible_subsampled = np.vstack([visible_subsampled, visible[-1:]])
+
+                # Map time to graph x: newest data at right edge
+                t_vals = visible_subsampled[:, 0]
+                v_vals = visible_subsampled[:, 1]
+                xs = t_vals - t_now + GRAPH_WINDOW
+                in_range = (xs >= 0) & (xs <= GRAPH_WINDOW)  # Only show points in range
 
                 # Convert to screen coordinates
-                points = []
-                for t_val, v_val in visible_subsampled:
-                    # Map time to graph x: newest data at right edge
-                    x_graph = t_val - t_now + GRAPH_WINDOW
-                    if 0 <= x_graph <= GRAPH_WINDOW:  # Only show points in range
-                        points.append(voltage_ax.c2p(x_graph, v_val))
+                points = axes_points(voltage_ax, xs[in_range], v_vals[in_range])
 
                 # Update curve
                 if len(points) > 1:
@@ -1,5 +1,8 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace, calculate_sinusoidal_flux
+from generator import (
+    axes_points, build_rotor, calculate_sine_voltage_trace, calculate_sinusoidal_flux,
+    visible_trace_points,
+)
 import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
@@ -95,7 +98,7 @@ class PhaseShiftExtendedScene(Scene):
         # ============================================================
         print(f"Calculating physics for Phase 1 ({len(coils_config)} coils)...")
 
-        coil_data_phase1 = {}  # coil_name -> List[(time, voltage)]
+        coil_data_phase1 = {}  # coil_name -> (N, 2) array of (time, voltage)
 
         for coil_cfg in coils_config:
             def make_coil_angle_func(motion_profile):
@@ -313,32 +316,17 @@ class PhaseShiftExtendedScene(Scene):
             label.add_updater(update_label_position)
 
         # Voltage curve updaters (Phase 1 - accumulating)
+        # Traces are mapped to scene points once; the updaters only slice them
+        coil_points_phase1 = {
+            name: axes_points(voltage_ax, trace[:, 0], trace[:, 1])
+            for name, trace in coil_data_phase1.items()
+        }
+
         for curve in curves_phase1:
             def update_curve(mob):
                 t_now = time_tracker.get_value()
-                trace = coil_data_phase1[mob.coil_name]
-
-                idx_end = int(t_now / dt_phase1)
-                idx_end = min(len(trace) - 1, max(0, idx_end))
-
-                visible = trace[0:idx_end + 1]
-
-                SUBSAMPLE_RATE = 3
-                visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-                if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                    visible_subsampled.append(visible[-1])
-
-                points = []
-                for t_val, v_val in visible_subsampled:
-                    points.append(voltage_ax.c2p(t_val, v_val))
-
-                if len(points) > 1:
-                    mob.set_points_as_corners(points)
-                elif len(points) == 1:
-                    mob.set_points_as_corners([points[0], points[0]])
-                else:
-                    mob.set_points_as_corners([])
+                points = coil_points_phase1[mob.coil_name]
+                mob.set_points_as_corners(visible_trace_points(points, t_now, dt_phase1))
 
             curve.add_updater(update_curve)
 
@@ -1,5 +1,8 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace, calculate_sinusoidal_flux
+from generator import (
+    axes_points, build_rotor, calculate_sine_voltage_trace, calculate_sinusoidal_flux,
+    visible_trace_points,
+)
 import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
@@ -87,7 +90,7 @@ class PhaseShiftSceneFinal(Scene):
         # ============================================================
         print(f"Calculating physics for {len(coils_config)} coil(s)...")
 
-        coil_data = {}  # coil_name -> List[(time, voltage)]
+        coil_data = {}  # coil_name -> (N, 2) array of (time, voltage)
 
         for coil_cfg in coils_config:
             # Create a function that returns coil angle at time t
@@ -248,44 +251,17 @@ class PhaseShiftSceneFinal(Scene):
             label.add_updater(update_label_position)
 
         # Voltage curve updaters (ACCUMULATING from t=0)
+        # Time maps 1:1 to graph x (x_range starts at 0), so each trace is
+        # converted to scene points once and the updaters only slice them
+        coil_points = {
+            name: axes_points(voltage_ax, trace[:, 0], trace[:, 1])
+            for name, trace in coil_data.items()
+        }
+
         for curve in curves:
             def update_curve(mob):
                 t_now = time_tracker.get_value()
-
-                # Get trace data for this coil
-                trace = coil_data[mob.coil_name]
-
-                # Calculate visible range [0, t_now]
-                idx_end = int(t_now / dt)
-                
-                # Clamp index
-                idx_end = min(len(trace) - 1, max(0, idx_end))
-                
-                # Extract visible points from start
-                visible = trace[0:idx_end + 1]
-
-                # Subsample to reduce point density (every 3rd point for smoother rendering)
-                SUBSAMPLE_RATE = 3
-                visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-                # Always include the last point for accuracy at the edge
-                if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                    visible_subsampled.append(visible[-1])
-
-                # Convert to screen coordinates
-                points = []
-                for t_val, v_val in visible_subsampled:
-                    # Map time to graph x: direct 1:1 mapping (since x_range starts at 0)
-                    x_graph = t_val
-                    points.append(voltage_ax.c2p(x_graph, v_val))
-
-                # Update curve
-                if len(points) > 1:
-                    mob.set_points_as_corners(points)
-                elif len(points) == 1:
-                    mob.set_points_as_corners([points[0], points[0]])
-                else:
-                    mob.set_points_as_corners([])
+                mob.set_points_as_corners(visible_trace_points(coil_points[mob.coil_name], t_now, dt))
 
             curve.add_updater(update_curve)
 
@@ -1,5 +1,5 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace
+from generator import axes_points, build_rotor, calculate_sine_voltage_trace, visible_trace_points
 import math
 import numpy as np
 from dataclasses import dataclass
@@ -166,32 +166,16 @@ class PhaseStaticScene(Scene):
         rotor_group.add_updater(update_rotor)
 
         # Voltage curve updaters
+        # Traces are mapped to scene points once; the updaters only slice them
+        coil_points = {
+            name: axes_points(combined_ax, trace[:, 0], trace[:, 1])
+            for name, trace in coil_data.items()
+        }
+
         for curve in curves:
             def update_curve(mob):
                 t_now = time_tracker.get_value()
-                trace = coil_data[mob.coil_name]
-
-                idx_end = int(t_now / dt)
-                idx_end = min(len(trace) - 1, max(0, idx_end))
-
-                visible = trace[0:idx_end + 1]
-
-                SUBSAMPLE_RATE = 3
-                visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-                if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                    visible_subsampled.append(visible[-1])
-
-                points = []
-                for t_val, v_val in visible_subsampled:
-                    points.append(combined_ax.c2p(t_val, v_val))
-
-                if len(points) > 1:
-                    mob.set_points_as_corners(points)
-                elif len(points) == 1:
-                    mob.set_points_as_corners([points[0], points[0]])
-                else:
-                    mob.set_points_as_corners([])
+                mob.set_points_as_corners(visible_trace_points(coil_points[mob.coil_name], t_now, dt))
 
             curve.add_updater(update_curve)
 
@@ -424,17 +408,10 @@ class TwoPhaseVsSplitPhaseScene(Scene):
         # --- PRE-DRAW VOLTAGE CURVES (no animation) ---
         def build_full_curve(trace, ax, color):
             """Build a complete curve from trace data."""
-            SUBSAMPLE_RATE = 3
-            visible_subsampled = trace[::SUBSAMPLE_RATE]
-            if len(trace) > 0 and (len(trace) - 1) % SUBSAMPLE_RATE != 0:
-                visible_subsampled.append(trace[-1])
-
-            points = [ax.c2p(t_val, v_val) for t_val, v_val in visible_subsampled]
-
-            curve = VMobject().set_color(color).set_stroke(width=2.5)
-            if len(points) > 1:
-                curve.set_points_as_corners(points)
-            return curve
+            points = axes_points(ax, trace[:, 0], trace[:, 1])
+            # Asking for a time past the last sample returns the whole subsampled trace
+            full = visible_trace_points(points, len(points), 1)
+            return VMobject().set_color(color).set_stroke(width=2.5).set_points_as_corners(full)
 
         # Two-phase curves (pre-drawn)
         curve_two_a = build_full_curve(two_phase_data["A"], ax_two_phase, BLUE)
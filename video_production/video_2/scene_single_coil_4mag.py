@@ -1,5 +1,5 @@
 from manim import *
-from generator import build_rotor, calculate_sine_voltage_trace
+from generator import axes_points, build_rotor, calculate_sine_voltage_trace, visible_trace_points
 import math
 import numpy as np
 
@@ -258,36 +258,12 @@ class SingleCoil4MagScene(Scene):
         rotor_group.add_updater(update_rotor)
 
         # Voltage curve updater (accumulating from t=0)
+        # The trace is mapped to scene points once; the updater only slices it
+        voltage_points = axes_points(voltage_ax, voltage_trace[:, 0], voltage_trace[:, 1])
+
         def update_voltage_curve(mob):
             t_now = time_tracker.get_value()
-
-            # Calculate index from time
-            idx_end = int(t_now / dt)
-            idx_end = min(len(voltage_trace) - 1, max(0, idx_end))
-
-            # Extract visible points from start
-            visible = voltage_trace[0:idx_end + 1]
-
-            # Subsample to reduce point density
-            SUBSAMPLE_RATE = 3
-            visible_subsampled = visible[::SUBSAMPLE_RATE]
-
-            # Always include the last point for accuracy
-            if len(visible) > 0 and (len(visible) - 1) % SUBSAMPLE_RATE != 0:
-                visible_subsampled.append(visible[-1])
-
-            # Convert to screen coordinates
-            points = []
-            for t_val, v_val in visible_subsampled:
-                points.append(voltage_ax.c2p(t_val, v_val))
-
-            # Update curve
-            if len(points) > 1:
-                mob.set_points_as_corners(points)
-            elif len(points) == 1:
-                mob.set_points_as_corners([points[0], points[0]])
-            else:
-                mob.set_points_as_corners([])
+            mob.set_points_as_corners(visible_trace_points(voltage_points, t_now, dt))
 
         voltage_curve.add_updater(update_voltage_curve)
 
@@ -34,7 +34,7 @@ class SinglePhaseScene(Scene):
 
         # Determine Max Voltage for Graph Scaling
         max_voltage = (
-            max([abs(v[1]) for v in voltage_data]) * 1.1 if voltage_data else 1.0
+            np.abs(voltage_data[:, 1]).max() * 1.1 if len(voltage_data) else 1.0
         )
 
         # --- VISUAL SETUP ---
@@ -47,7 +47,7 @@ class TwoPhaseScene(Scene):
         # Determine Max Voltage for Graph Scaling
         # Scale to peak ~10V
         raw_max = max(
-            [abs(v[1]) for v in voltage_data_a] + [abs(v[1]) for v in voltage_data_b]
+            np.abs(voltage_data_a[:, 1]).max(), np.abs(voltage_data_b[:, 1]).max()
         )
         scale_factor = 10.0 / raw_max if raw_max != 0 else 1.0
 